@@ -1,31 +1,43 @@
 """Audio capture from microphone."""
 
+import asyncio
+import os
 import queue
 import threading
-import json
-import time
 import sounddevice as sd
 import numpy as np
-from typing import Optional, Callable
+from multiprocessing import shared_memory
+from typing import AsyncIterator, Optional, Callable, Tuple
 
-# #region agent log
-DEBUG_LOG_PATH = "/home/jb/dev/VocalNode/.cursor/debug.log"
-def _debug_log(session_id, run_id, hypothesis_id, location, message, data=None):
+from .debug_log import DEBUG, VERBOSE as _VERBOSE, debug_log as _debug_log
+
+# Samples are captured and buffered as 16-bit PCM, the native format of most
+# input devices and half the size of float32. STTEngine scales to float.
+SAMPLE_DTYPE = np.int16
+# SCHED_FIFO priority requested for the capture thread (1-99)
+CAPTURE_RT_PRIORITY = 10
+# A shared-memory ring starts with this header: the uint64 count of blocks
+# written so far, followed by the (slots, blocksize) int16 sample slots
+SHARED_HEADER_BYTES = 8
+
+
+def _raise_thread_priority() -> None:
+    """Best-effort scheduling boost for the calling thread.
+    
+    Tries SCHED_FIFO first, then a negative nice value. Both need
+    CAP_SYS_NICE or a suitable RLIMIT_RTPRIO/RLIMIT_NICE; without them, or
+    off Linux, the thread simply keeps its default priority.
+    """
     try:
-        with open(DEBUG_LOG_PATH, 'a') as f:
-            log_entry = {
-                "sessionId": session_id,
-                "runId": run_id,
-                "hypothesisId": hypothesis_id,
-                "location": location,
-                "message": message,
-                "data": data or {},
-                "timestamp": int(time.time() * 1000)
-            }
-            f.write(json.dumps(log_entry) + "\n")
-    except:
+        # pid 0 targets the calling thread on Linux
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(CAPTURE_RT_PRIORITY))
+        return
+    except (AttributeError, OSError):
+        pass
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -10)
+    except (AttributeError, OSError):
         pass
-# #endregion
 
 
 class AudioCapture:
@@ -43,29 +55,87 @@ class AudioCapture:
         self.sample_rate = sample_rate
         self.channels = channels
         self.device_id = config.get("audio.device_id")
+        self._input_devices: Optional[list] = None
         self.is_recording = False
-        self.audio_queue = queue.Queue()
-        self.stream: Optional[sd.InputStream] = None
+        self.stream: Optional[sd.RawInputStream] = None
+        self._reader_thread: Optional[threading.Thread] = None
         self.callback: Optional[Callable] = None
-        self._callback_count = 0  # For debug logging
+        # Per-block hooks installed by stream_chunks(); called with None
+        # when recording stops
+        self._block_listeners: list = []
+        # Called once, on the capture thread, when a recording outgrows the
+        # ring and starts losing audio; must not block
+        self.on_buffer_full: Optional[Callable[[], None]] = None
+        self._ring_full = False  # Set by the first dropped block of a recording
+        self._callback_count = 0  # Blocks read, for diagnostics
+        
+        # Single-producer/single-consumer ring of fixed-size blocks. The capture
+        # thread is the only writer of _w and never takes a lock: plain int
+        # stores are atomic under the GIL. Readers advance _r under
+        # _read_lock, which the capture thread never touches. The slot count
+        # is a power of two so indices wrap with a mask.
+        # 1600 samples = 100 ms at 16 kHz, a whole number of Whisper's
+        # 160-sample (10 ms) feature hops
+        self.blocksize = int(config.get("audio.blocksize", 1600))
+        max_samples = int(config.get("audio.max_seconds", 120) * self.sample_rate)
+        min_slots = max(1, -(-max_samples // self.blocksize))
+        self._slots = 1 << (min_slots - 1).bit_length()
+        self._mask = self._slots - 1
+        ring_shape = (self._slots, self.blocksize)
+        # Optionally back the ring with shared memory so another process
+        # (e.g. an STT worker) can attach and read it without serialization
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._shared_w = None
+        if config.get("audio.shared_memory", False):
+            nbytes = SHARED_HEADER_BYTES + self._slots * self.blocksize * np.dtype(SAMPLE_DTYPE).itemsize
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._shared_w, self._ring = self._map_shared_ring(self._shm, self._slots, self.blocksize)
+            self._shared_w[0] = 0
+        else:
+            self._ring = np.empty(ring_shape, dtype=SAMPLE_DTYPE)
+        self._ring_flat = self._ring.reshape(-1)  # View, no copy
+        self._w = 0
+        self._r = 0
+        self._read_lock = threading.Lock()
+        self._held: Optional[int] = None  # Block index lent by acquire_chunk()
+        # Set by the writer only while a reader is blocked waiting for data
+        self._data_ready = threading.Event()
+        self._reader_waiting = False
+        # Diagnostics raised on the capture thread are handed to a background
+        # writer so reads never wait on the filesystem.
+        self._diag_queue = queue.Queue(maxsize=256)
+        self._diag_thread = threading.Thread(target=self._drain_diag, daemon=True)
+        self._diag_thread.start()
     
     def list_devices(self) -> list:
         """List available audio input devices.
         
+        The PortAudio query is cached; call refresh_devices() to re-query.
+        
         Returns:
             List of device dictionaries
         """
-        devices = sd.query_devices()
-        input_devices = []
-        for i, device in enumerate(devices):
-            if device['max_input_channels'] > 0:
-                input_devices.append({
+        if self._input_devices is None:
+            self._input_devices = [
+                {
                     'id': i,
                     'name': device['name'],
                     'channels': device['max_input_channels'],
                     'sample_rate': device['default_samplerate']
-                })
-        return input_devices
+                }
+                for i, device in enumerate(sd.query_devices())
+                if device['max_input_channels'] > 0
+            ]
+        return self._input_devices
+    
+    def refresh_devices(self) -> list:
+        """Drop the cached device list and query PortAudio again.
+        
+        Returns:
+            List of device dictionaries
+        """
+        self._input_devices = None
+        return self.list_devices()
     
     def start_recording(self, callback: Optional[Callable] = None) -> bool:
         """Start recording audio.
@@ -80,39 +150,50 @@ class AudioCapture:
             return False
         
         self.callback = callback
+        # Each recording starts at slot 0 so it sits contiguously in the
+        # flat ring unless it exceeds the ring's capacity
+        with self._read_lock:
+            self._r = self._w = 0
+            self._held = None
+            self._ring_full = False
+            if self._shared_w is not None:
+                self._shared_w[0] = 0
         self.is_recording = True
         
+        # Channel count is fixed for the stream's lifetime, so pick the
+        # conversion once instead of branching on every block
+        to_mono = self._mono_view if self.channels == 1 else self._multi_view
+        
         try:
-            # #region agent log
-            _debug_log("debug-session", "run1", "H2", "audio_capture.py:start_recording:before_stream", "Before creating InputStream", {"device_id": self.device_id, "channels": self.channels, "sample_rate": self.sample_rate})
-            # #endregion
-            self.stream = sd.InputStream(
+            # Blocking (callback-less) stream: reads happen on our own thread
+            # and Pa_ReadStream runs in C without the GIL, so no Python code
+            # executes on PortAudio's realtime thread
+            self.stream = sd.RawInputStream(
                 device=self.device_id,
                 channels=self.channels,
                 samplerate=self.sample_rate,
-                dtype=np.float32,
-                callback=self._audio_callback,
-                blocksize=int(self.sample_rate * 0.5)  # 0.5 second blocks
+                dtype=np.dtype(SAMPLE_DTYPE).name,
+                blocksize=self.blocksize
             )
-            # #region agent log
-            _debug_log("debug-session", "run1", "H2", "audio_capture.py:start_recording:stream_created", "InputStream created, starting stream")
-            # #endregion
             self.stream.start()
-            # #region agent log
-            _debug_log("debug-session", "run1", "H2", "audio_capture.py:start_recording:stream_started", "Stream started successfully", {"stream_active": self.stream.active})
-            # #endregion
+            self._reader_thread = threading.Thread(
+                target=self._reader_loop, args=(self.stream, to_mono), daemon=True
+            )
+            self._reader_thread.start()
             return True
         except Exception as e:
             print(f"Error starting audio capture: {e}")
-            # #region agent log
-            _debug_log("debug-session", "run1", "H2", "audio_capture.py:start_recording:exception", "Exception starting audio capture", {"error": str(e), "type": type(e).__name__})
-            # #endregion
             self.is_recording = False
             return False
     
     def stop_recording(self) -> None:
         """Stop recording audio."""
         self.is_recording = False
+        # Let the reader finish its current block before the stream goes away
+        if self._reader_thread is not None:
+            self._reader_thread.join(timeout=2.0)
+            self._reader_thread = None
+        self._notify_listeners(None, 0)
         if self.stream is not None:
             try:
                 self.stream.stop()
@@ -121,50 +202,236 @@ class AudioCapture:
                 pass
             self.stream = None
     
-    def _audio_callback(self, indata, frames, time_info, status):
-        """Callback function for audio stream."""
-        # #region agent log
-        callback_count = getattr(self, '_callback_count', 0) + 1
-        self._callback_count = callback_count
-        if callback_count % 20 == 0:  # Log every 20th callback to avoid spam
-            _debug_log("debug-session", "run1", "H2", "audio_capture.py:_audio_callback:entry", "Audio callback", {"callback_count": callback_count, "is_recording": self.is_recording, "frames": frames, "queue_size": self.audio_queue.qsize()})
-        # #endregion
-        if status:
-            print(f"Audio callback status: {status}")
-            # #region agent log
-            _debug_log("debug-session", "run1", "H2", "audio_capture.py:_audio_callback:status", "Audio callback status", {"status": str(status)})
-            # #endregion
+    def shared_ring_info(self) -> Optional[dict]:
+        """Describe the shared-memory ring for another process.
         
-        if self.is_recording:
-            # Convert to mono if stereo
-            audio_data = indata[:, 0] if indata.ndim > 1 else indata
+        Returns:
+            Dict with the segment name and ring shape, or None when
+            audio.shared_memory is disabled
+        """
+        if self._shm is None:
+            return None
+        return {
+            "name": self._shm.name,
+            "slots": self._slots,
+            "blocksize": self.blocksize,
+        }
+    
+    @staticmethod
+    def _map_shared_ring(shm: shared_memory.SharedMemory, slots: int, blocksize: int) -> Tuple[np.ndarray, np.ndarray]:
+        """View a shared-memory segment as (write index, sample slots)."""
+        write_index = np.ndarray((1,), dtype=np.uint64, buffer=shm.buf)
+        ring = np.ndarray((slots, blocksize), dtype=SAMPLE_DTYPE, buffer=shm.buf, offset=SHARED_HEADER_BYTES)
+        return write_index, ring
+    
+    @staticmethod
+    def attach_shared_ring(name: str, slots: int, blocksize: int) -> Tuple[shared_memory.SharedMemory, np.ndarray, np.ndarray]:
+        """Attach to a ring published by shared_ring_info() in another process.
+        
+        ``write_index[0]`` counts the blocks written since recording
+        started; it is updated after each block is copied in. Block ``i``
+        lives in row ``i % slots``, so blocks
+        ``[max(0, w - slots), w)`` are readable. Keep the returned
+        SharedMemory referenced for as long as the arrays are used.
+        
+        Returns:
+            (SharedMemory handle, 1-element uint64 write index view,
+            (slots, blocksize) int16 view)
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        write_index, ring = AudioCapture._map_shared_ring(shm, slots, blocksize)
+        return shm, write_index, ring
+    
+    def close(self) -> None:
+        """Stop recording and release the shared-memory ring, if any."""
+        self.stop_recording()
+        if self._shm is not None:
+            self._ring = self._ring_flat = self._shared_w = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+    
+    def _reader_loop(self, stream, to_mono):
+        """Read blocks from the stream until recording stops."""
+        _raise_thread_priority()
+        blocksize = self.blocksize
+        while self.is_recording:
+            try:
+                data, overflowed = stream.read(blocksize)
+            except Exception as e:
+                self._diag("audio_capture.py:_reader_loop:read", "Error reading audio", e, 0)
+                break
+            self._store_block(to_mono(data, blocksize), blocksize, overflowed)
+    
+    def _mono_view(self, data, frames):
+        """View a raw single-channel buffer as int16 samples."""
+        return np.frombuffer(data, dtype=SAMPLE_DTYPE, count=frames)
+    
+    def _multi_view(self, data, frames):
+        """View the first channel of a raw interleaved buffer."""
+        channels = self.channels
+        return np.frombuffer(data, dtype=SAMPLE_DTYPE, count=frames * channels)[::channels]
+    
+    def _store_block(self, samples, frames, overflowed):
+        """Copy one block of mono samples into the ring buffer.
+        
+        Runs on the capture thread for every block, so it must not block:
+        no file I/O, no printing and no allocation beyond a copy into the
+        ring. ``samples`` is a view over the raw read buffer.
+        """
+        self._callback_count += 1
+        if overflowed:
+            self._diag("audio_capture.py:_store_block:overflow", "Audio input status", "input overflow", frames)
+        
+        w = self._w
+        if w - self._r >= self._slots:
+            # Ring full, drop frame. Report only the first drop of a
+            # recording, so the diagnostics queue is not flooded.
+            if not self._ring_full:
+                self._ring_full = True
+                self._diag("audio_capture.py:_store_block:ring_full", "Recording buffer full, dropping audio", "longer than audio.max_seconds", frames)
+                if self.on_buffer_full is not None:
+                    try:
+                        self.on_buffer_full()
+                    except Exception as e:
+                        self._diag("audio_capture.py:_store_block:on_buffer_full", "Error in buffer-full callback", e, frames)
+            return
+        
+        audio_data = self._ring[w & self._mask, :frames]
+        np.copyto(audio_data, samples)
+        self._w = w + 1
+        if self._shared_w is not None:
+            self._shared_w[0] = w + 1
+        if self._reader_waiting:
+            self._data_ready.set()
+        
+        # Call user callback if provided
+        if self.callback:
+            try:
+                self.callback(audio_data)
+            except Exception as e:
+                self._diag("audio_capture.py:_store_block:user_callback", "Error in audio callback", e, frames)
+        if self._block_listeners:
+            self._notify_listeners(audio_data, frames)
+    
+    def _notify_listeners(self, block, frames):
+        """Pass a block (or None at the end of a recording) to each listener.
+        
+        A listener that raises, e.g. one whose event loop has closed, is
+        reported and unregistered so it cannot stop capture.
+        """
+        failed = None
+        for listener in self._block_listeners:
+            try:
+                listener(block)
+            except Exception as e:
+                self._diag("audio_capture.py:_notify_listeners", "Error in block listener, removing it", e, frames)
+                failed = failed or []
+                failed.append(listener)
+        if failed:
+            for listener in failed:
+                self._discard_listener(listener)
+    
+    def _discard_listener(self, listener) -> None:
+        """Unregister a block listener if it is still registered."""
+        try:
+            self._block_listeners.remove(listener)
+        except ValueError:
+            pass
+    
+    async def stream_chunks(self) -> AsyncIterator[np.ndarray]:
+        """Yield recorded blocks to asyncio code as they arrive.
+        
+        Each block is copied on the capture thread and handed to the
+        running event loop with call_soon_threadsafe, so awaiting the next
+        chunk never blocks the loop. Iteration ends when recording stops.
+        Blocks stay in the ring buffer for get_all_audio().
+        
+        Yields:
+            Audio chunks as numpy arrays
+        """
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        
+        def on_block(block):
+            # Raises RuntimeError once the loop is closed; the capture thread
+            # then drops this listener
+            loop.call_soon_threadsafe(chunks.put_nowait, None if block is None else block.copy())
+        
+        self._block_listeners.append(on_block)
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            self._discard_listener(on_block)
+    
+    def _diag(self, location, message, detail, frames):
+        """Queue a diagnostic record without blocking the caller."""
+        try:
+            self._diag_queue.put_nowait((location, message, detail, frames, self._callback_count))
+        except queue.Full:
+            pass  # Diagnostics are best-effort
+    
+    def _drain_diag(self):
+        """Report queued diagnostics from a background thread."""
+        while True:
+            location, message, detail, frames, callback_count = self._diag_queue.get()
+            if detail is not None:
+                print(f"{message}: {detail}")
             # #region agent log
-            if callback_count % 20 == 0:
-                _debug_log("debug-session", "run1", "H2", "audio_capture.py:_audio_callback:processing", "Processing audio data", {"audio_shape": audio_data.shape, "audio_max": float(np.max(np.abs(audio_data)))})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H2", location, message, {"detail": str(detail) if detail is not None else None, "frames": frames, "callback_count": callback_count})
             # #endregion
-            
-            # Put in queue for processing
+    
+    def _wait_for_data(self, timeout: float) -> bool:
+        """Block until the ring has an unread block or the timeout expires."""
+        if self._r == self._w:
+            # Announce the wait before re-checking so the writer either sees
+            # the flag and signals, or its block is seen by the re-check
+            self._reader_waiting = True
+            self._data_ready.clear()
             try:
-                self.audio_queue.put_nowait(audio_data.copy())
-                # #region agent log
-                if callback_count % 20 == 0:
-                    _debug_log("debug-session", "run1", "H2", "audio_capture.py:_audio_callback:queued", "Audio data queued", {"queue_size": self.audio_queue.qsize()})
-                # #endregion
-            except queue.Full:
-                # #region agent log
-                _debug_log("debug-session", "run1", "H2", "audio_capture.py:_audio_callback:queue_full", "Queue full, dropping frame")
-                # #endregion
-                pass  # Drop frame if queue is full
+                if self._r == self._w and not self._data_ready.wait(timeout):
+                    return False
+            finally:
+                self._reader_waiting = False
+        return True
+    
+    def acquire_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
+        """Borrow the oldest unread block without copying it.
+        
+        The ring slots act as a fixed buffer pool: the returned view stays
+        valid until release_chunk(), because the writer never reuses a slot
+        that has not been released. Hold at most one block at a time.
+        
+        Args:
+            timeout: Timeout in seconds
             
-            # Call user callback if provided
-            if self.callback:
-                try:
-                    self.callback(audio_data)
-                except Exception as e:
-                    print(f"Error in audio callback: {e}")
+        Returns:
+            View of the block, or None on timeout
+        """
+        if not self._wait_for_data(timeout):
+            return None
+        with self._read_lock:
+            r = self._r
+            if r == self._w:
+                return None
+            self._held = r
+            return self._ring[r & self._mask]
+    
+    def release_chunk(self) -> None:
+        """Return the block from acquire_chunk() to the writer."""
+        with self._read_lock:
+            # Skip if another read already consumed past the held block
+            if self._held is not None and self._r == self._held:
+                self._r += 1
+            self._held = None
     
     def get_audio_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
-        """Get next audio chunk from queue.
+        """Get a copy of the next audio chunk from the ring buffer.
         
         Args:
             timeout: Timeout in seconds
@@ -172,33 +439,91 @@ class AudioCapture:
         Returns:
             Audio chunk as numpy array or None
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
+        chunk = self.acquire_chunk(timeout)
+        if chunk is None:
             return None
+        chunk = chunk.copy()
+        self.release_chunk()
+        return chunk
     
-    def get_all_audio(self) -> np.ndarray:
+    def get_all_audio(self, copy: bool = True) -> np.ndarray:
         """Get all buffered audio as single array.
         
+        Args:
+            copy: If False and the buffered blocks are contiguous in the
+                ring, return a view instead of a copy. The view is only
+                valid until the next start_recording(). A shared-memory
+                ring is always copied, since close() unmaps it even while
+                a view is still in use.
+        
         Returns:
             Concatenated audio array
         """
-        chunks = []
-        queue_size = self.audio_queue.qsize()
-        print(f"Audio queue size: {queue_size}")
+        with self._read_lock:
+            r, w = self._r, self._w
+            first = r & self._mask
+            if not copy and self._shm is None and first + (w - r) <= self._slots:
+                audio = self._ring_flat[first * self.blocksize:(first + w - r) * self.blocksize]
+            else:
+                audio = np.empty((w - r) * self.blocksize, dtype=SAMPLE_DTYPE)
+                self._copy_blocks(r, w, audio)
+            self._r = w
         
-        while True:
-            try:
-                chunk = self.audio_queue.get_nowait()
-                chunks.append(chunk)
-            except queue.Empty:
-                break
+        if _VERBOSE:
+            if len(audio):
+                print(f"Retrieved {w - r} chunks from ring buffer, total samples: {len(audio)}")
+            else:
+                print("No audio chunks in ring buffer")
+        return audio
+    
+    def get_recent_audio(self, max_samples: int) -> np.ndarray:
+        """Copy the most recent buffered audio without consuming it.
         
-        if chunks:
-            total_samples = sum(len(chunk) for chunk in chunks)
-            print(f"Retrieved {len(chunks)} chunks from queue, total samples: {total_samples}")
-            return np.concatenate(chunks)
+        Args:
+            max_samples: Upper bound on samples returned; rounded down to
+                whole blocks
         
-        print("No audio chunks in queue")
-        return np.array([], dtype=np.float32)
-
+        Returns:
+            Copy of up to ``max_samples`` of the latest audio, oldest first
+        """
+        with self._read_lock:
+            r, w = self._r, self._w
+            r = max(r, w - max_samples // self.blocksize)
+            audio = np.empty((w - r) * self.blocksize, dtype=SAMPLE_DTYPE)
+            self._copy_blocks(r, w, audio)
+        return audio
+    
+    def drain_into(self, out: np.ndarray) -> int:
+        """Move buffered audio into a caller-owned array.
+        
+        Copies as many whole blocks as fit in ``out`` and consumes them
+        from the ring. The copies are np.copyto slices, which NumPy runs
+        with the GIL released, so consumers should prefer this over
+        aggregating chunks in a Python loop.
+        
+        Args:
+            out: Int16 array to fill from the start
+            
+        Returns:
+            Number of samples written
+        """
+        with self._read_lock:
+            r = self._r
+            w = min(self._w, r + len(out) // self.blocksize)
+            self._copy_blocks(r, w, out)
+            self._r = w
+        return (w - r) * self.blocksize
+    
+    def _copy_blocks(self, r: int, w: int, out: np.ndarray) -> None:
+        """Copy ring blocks [r, w) into ``out`` in order.
+        
+        Slots are contiguous in the flat ring, so this is one slice copy,
+        or two when the range wraps past the end of the ring.
+        """
+        blocksize = self.blocksize
+        first = r & self._mask
+        count = w - r
+        head = min(count, self._slots - first)
+        np.copyto(out[:head * blocksize], self._ring_flat[first * blocksize:(first + head) * blocksize])
+        if count > head:
+            np.copyto(out[head * blocksize:], self._ring_flat[:(count - head) * blocksize])
@@ -1,7 +1,9 @@
 """Configuration management for VocalNode."""
 
+import copy
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -9,6 +11,10 @@ from typing import Dict, Any, Optional
 class Config:
     """Manages application configuration."""
     
+    # Seconds to wait after a set() before writing, so bursts of changes
+    # are persisted with a single write
+    SAVE_DELAY = 0.5
+    
     DEFAULT_CONFIG = {
         "hotkey": {
             "key": "f8",
@@ -18,22 +24,30 @@ class Config:
         "stt": {
             "model": "base",
             "language": "en",
-            "device": "cpu"  # "cpu" or "cuda"
+            "beam_size": 1,  # 1 = greedy (fastest), up to 5 for beam search
+            "normalize": False,  # Peak-normalize audio before transcribing
+            "device": "cpu",  # "cpu" or "cuda"
+            "compute_type": "auto",  # "auto", "int8", "int8_float16", "float16" or "float32"
+            "cpu_threads": 0  # 0 = all cores but one
         },
         "audio": {
             "device_id": None,  # None = default device
             "sample_rate": 16000,
-            "channels": 1
+            "channels": 1,
+            "blocksize": 1600,  # Samples per capture block (100 ms at 16 kHz)
+            "max_seconds": 120,  # Longest recording kept in the capture buffer
+            "shared_memory": False  # Back the capture buffer with shared memory
         },
         "overlay": {
             "enabled": True,
             "position": "bottom_right",  # "top_left", "top_right", "bottom_left", "bottom_right", "center"
             "show_text": True,
+            "live_preview": False,  # Transcribe the last few seconds while recording
             "opacity": 0.9
         },
         "text_insertion": {
-            "method": "typing",  # "typing" or "clipboard"
-            "typing_delay": 0.01
+            "method": "auto",  # "auto" (paste long text), "typing" or "clipboard"
+            "typing_delay": 0.0  # Seconds paused per typed chunk; some X11/Wayland setups need 0.002-0.005
         }
     }
     
@@ -50,6 +64,9 @@ class Config:
         
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
         self.load()
     
     def load(self) -> None:
@@ -62,31 +79,61 @@ class Config:
                 self._merge_defaults()
             except Exception as e:
                 print(f"Error loading config: {e}")
-                self.config = self.DEFAULT_CONFIG.copy()
+                self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         else:
-            self.config = self.DEFAULT_CONFIG.copy()
+            self.config = copy.deepcopy(self.DEFAULT_CONFIG)
             self.save()
+        self._rebuild_flat()
     
     def save(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file.
+        
+        Writes a temporary file next to the config and renames it over the
+        original, so a crash mid-write never leaves a truncated config.
+        """
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with self._lock:
+                with open(tmp_path, 'w') as f:
+                    json.dump(self.config, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_path)
         except Exception as e:
             print(f"Error saving config: {e}")
     
     def _merge_defaults(self) -> None:
-        """Merge loaded config with defaults to ensure all keys exist."""
-        def merge_dict(default: Dict, loaded: Dict) -> Dict:
-            result = default.copy()
-            for key, value in loaded.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = merge_dict(result[key], value)
-                else:
-                    result[key] = value
-            return result
-        self.config = merge_dict(self.DEFAULT_CONFIG, self.config)
+        """Merge loaded config with defaults to ensure all keys exist.
+        
+        Missing keys are filled in place from a copy of the defaults, so
+        later set() calls never mutate DEFAULT_CONFIG.
+        """
+        stack = [(self.config, self.DEFAULT_CONFIG)]
+        while stack:
+            loaded, default = stack.pop()
+            for key, value in default.items():
+                if key not in loaded:
+                    loaded[key] = copy.deepcopy(value)
+                elif isinstance(value, dict) and isinstance(loaded[key], dict):
+                    stack.append((loaded[key], value))
+    
+    def _rebuild_flat(self) -> None:
+        """Rebuild the dot-path lookup table used by get().
+        
+        Every path is indexed, including intermediate dicts, so lookups
+        behave exactly like walking the nested config.
+        """
+        flat = {}
+        stack = [("", self.config)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = prefix + key
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((path + ".", value))
+        self._flat = flat
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value by dot-separated path.
@@ -98,14 +145,7 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key_path.split('.')
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        return self._flat.get(key_path, default)
     
     def set(self, key_path: str, value: Any) -> None:
         """Set configuration value by dot-separated path.
@@ -114,12 +154,43 @@ class Config:
             key_path: Dot-separated path (e.g., "hotkey.key")
             value: Value to set
         """
-        keys = key_path.split('.')
-        config = self.config
-        for key in keys[:-1]:
-            if key not in config:
-                config[key] = {}
-            config = config[key]
-        config[keys[-1]] = value
-        self.save()
+        self.update({key_path: value})
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several values at once.
+        
+        The lookup table is rebuilt and a save scheduled once for the whole
+        batch rather than once per key.
+        
+        Args:
+            values: Mapping of dot-separated paths to values
+        """
+        with self._lock:
+            for key_path, value in values.items():
+                keys = key_path.split('.')
+                config = self.config
+                for key in keys[:-1]:
+                    if key not in config:
+                        config[key] = {}
+                    config = config[key]
+                config[keys[-1]] = value
+            self._rebuild_flat()
+            self._schedule_save()
+    
+    def _schedule_save(self) -> None:
+        """Arrange for a save on a background timer unless one is pending."""
+        with self._lock:
+            if self._save_timer is None:
+                # Non-daemon so a pending write still lands at interpreter exit
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write pending changes to disk immediately."""
+        with self._lock:
+            timer = self._save_timer
+            self._save_timer = None
+        if timer is not None:
+            timer.cancel()
+            self.save()
 
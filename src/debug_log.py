@@ -0,0 +1,79 @@
+"""Opt-in debug logging written from a background thread."""
+
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+
+try:
+    import orjson  # Optional, faster serialization
+except ImportError:
+    orjson = None
+
+# Debug logging is off unless VOCALNODE_DEBUG=1. Call sites should still
+# guard with `if DEBUG:` so their argument dicts are never built.
+DEBUG = os.environ.get("VOCALNODE_DEBUG") == "1"
+# Per-dictation progress messages on stdout are opt-in; errors always print
+VERBOSE = os.environ.get("VOCALNODE_VERBOSE") == "1"
+DEBUG_LOG_PATH = os.environ.get("VOCALNODE_DEBUG_LOG", str(Path.home() / ".vocalnode" / "debug.log"))
+BATCH_SIZE = 64
+
+_log_queue: "queue.SimpleQueue[dict]" = queue.SimpleQueue()
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+
+def _encode(log_entry: dict) -> bytes:
+    """Serialize one log line."""
+    if orjson is not None:
+        return orjson.dumps(log_entry, default=str) + b"\n"
+    return (json.dumps(log_entry, default=str) + "\n").encode()
+
+
+def _write_loop():
+    """Drain queued records in batches to a file handle kept open."""
+    log_file = None
+    while True:
+        batch = [_log_queue.get()]
+        try:
+            while len(batch) < BATCH_SIZE:
+                batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            if log_file is None:
+                Path(DEBUG_LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
+                log_file = open(DEBUG_LOG_PATH, 'ab', buffering=1 << 16)
+            log_file.write(b"".join(_encode(entry) for entry in batch))
+            log_file.flush()
+        except OSError:
+            pass
+
+
+def _enqueue(session_id, run_id, hypothesis_id, location, message, data=None):
+    """Queue one record; serialization and file I/O happen on the writer thread."""
+    global _writer_thread
+    if _writer_thread is None:
+        with _writer_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(target=_write_loop, daemon=True)
+                _writer_thread.start()
+    _log_queue.put({
+        "sessionId": session_id,
+        "runId": run_id,
+        "hypothesisId": hypothesis_id,
+        "location": location,
+        "message": message,
+        "data": data or {},
+        "timestamp": int(time.time() * 1000)
+    })
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+# Bound once at import: a no-op unless debugging is enabled
+debug_log = _enqueue if DEBUG else _noop
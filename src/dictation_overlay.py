@@ -1,12 +1,23 @@
 """Dictation overlay window with visual feedback."""
 
 import sys
-import numpy as np
+import math
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QApplication
 from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty
 from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QBrush
 from typing import Optional
 
+# Overlay anchor per position setting, in halves of the free space on each
+# axis: 0 = near edge, 1 = centred, 2 = far edge
+_POSITION_ANCHORS = {
+    "top_left": (0, 0),
+    "top_right": (2, 0),
+    "bottom_left": (0, 2),
+    "bottom_right": (2, 2),
+    "center": (1, 1),
+}
+_OVERLAY_MARGIN = 20
+
 
 class DictationOverlay(QWidget):
     """Floating overlay window showing dictation status."""
@@ -22,10 +33,15 @@ class DictationOverlay(QWidget):
         self.is_listening = False
         self.current_text = ""
         self.animation_value = 0.0
+        self._screen = None
+        self._screen_geo = None
+        self._anchor = _POSITION_ANCHORS["bottom_right"]
         
         self.setup_ui()
         self.setup_animation()
-        self.update_position()
+        QApplication.instance().primaryScreenChanged.connect(self._track_primary_screen)
+        self._track_primary_screen(QApplication.primaryScreen())
+        self.apply_config()
     
     def setup_ui(self):
         """Setup the UI components."""
@@ -40,6 +56,21 @@ class DictationOverlay(QWidget):
         # Set size
         self.setFixedSize(300, 120)
         
+        # Precompute waveform geometry and paint objects; the size is fixed,
+        # so none of this changes between paint events
+        bar_width = 4
+        bar_spacing = 6
+        num_bars = 8
+        start_x = (self.width() - (num_bars * (bar_width + bar_spacing) - bar_spacing)) // 2
+        self._bar_width = bar_width
+        self._bar_xs = [start_x + i * (bar_width + bar_spacing) for i in range(num_bars)]
+        self._bar_center_y = self.height() // 2
+        self._phases = tuple(i / num_bars * math.tau for i in range(num_bars))
+        self._pen_bar = QPen(QColor(255, 255, 255, 180), 2)
+        self._pen_none = QPen(Qt.PenStyle.NoPen)
+        self._brush_idle = QBrush(QColor(66, 66, 66, 200))  # Dark gray
+        self._color_listen = QColor(33, 150, 243)  # Blue, alpha set per frame
+        
         # Create layout
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 10, 10, 10)
@@ -85,33 +116,42 @@ class DictationOverlay(QWidget):
         self.animation.setEndValue(1.0)
         self.animation.setEasingCurve(QEasingCurve.Type.InOutSine)
         self.animation.setLoopCount(-1)  # Infinite loop
+        
+        # The animation only advances animation_value; repaints are driven
+        # by this timer at ~20 Hz instead of on every ~60 Hz animation tick
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setInterval(50)
+        self._repaint_timer.timeout.connect(self.update)
     
-    def update_position(self):
-        """Update overlay position based on config."""
+    def apply_config(self):
+        """Re-read position settings from config and reposition."""
         position = self.config.get("overlay.position", "bottom_right")
-        
-        # Get screen geometry
-        screen = QApplication.primaryScreen().geometry()
-        width = self.width()
-        height = self.height()
-        margin = 20
-        
-        if position == "top_left":
-            x = margin
-            y = margin
-        elif position == "top_right":
-            x = screen.width() - width - margin
-            y = margin
-        elif position == "bottom_left":
-            x = margin
-            y = screen.height() - height - margin
-        elif position == "bottom_right":
-            x = screen.width() - width - margin
-            y = screen.height() - height - margin
-        else:  # center
-            x = (screen.width() - width) // 2
-            y = (screen.height() - height) // 2
-        
+        self._anchor = _POSITION_ANCHORS.get(position, _POSITION_ANCHORS["center"])
+        self.update_position()
+    
+    def _track_primary_screen(self, screen):
+        """Cache the primary screen geometry and follow its changes."""
+        if self._screen is not None:
+            try:
+                self._screen.geometryChanged.disconnect(self._on_screen_geometry_changed)
+            except TypeError:
+                pass
+        self._screen = screen
+        screen.geometryChanged.connect(self._on_screen_geometry_changed)
+        self._on_screen_geometry_changed(screen.geometry())
+    
+    def _on_screen_geometry_changed(self, geometry):
+        """Handle primary screen resize."""
+        self._screen_geo = geometry
+        self.update_position()
+    
+    def update_position(self):
+        """Move overlay to the cached anchor on the cached screen geometry."""
+        screen = self._screen_geo
+        margin = _OVERLAY_MARGIN
+        ax, ay = self._anchor
+        x = margin + ax * (screen.width() - self.width() - 2 * margin) // 2
+        y = margin + ay * (screen.height() - self.height() - 2 * margin) // 2
         self.move(x, y)
     
     def paintEvent(self, event):
@@ -124,14 +164,13 @@ class DictationOverlay(QWidget):
             # Pulsing blue when listening
             base_alpha = 200
             pulse_alpha = int(50 * self.animation_value)
-            alpha = min(255, base_alpha + pulse_alpha)
-            bg_color = QColor(33, 150, 243, alpha)  # Blue
+            self._color_listen.setAlpha(min(255, base_alpha + pulse_alpha))
+            painter.setBrush(self._color_listen)
         else:
-            bg_color = QColor(66, 66, 66, 200)  # Dark gray
+            painter.setBrush(self._brush_idle)
         
         # Draw rounded rectangle background
-        painter.setBrush(QBrush(bg_color))
-        painter.setPen(QPen(Qt.PenStyle.NoPen))
+        painter.setPen(self._pen_none)
         painter.drawRoundedRect(self.rect(), 10, 10)
         
         # Draw waveform animation when listening
@@ -140,27 +179,17 @@ class DictationOverlay(QWidget):
     
     def draw_waveform(self, painter):
         """Draw animated waveform indicator."""
-        painter.setPen(QPen(QColor(255, 255, 255, 180), 2))
-        
-        width = self.width()
-        height = self.height()
-        center_y = height // 2
-        bar_width = 4
-        bar_spacing = 6
-        num_bars = 8
-        
-        start_x = (width - (num_bars * (bar_width + bar_spacing) - bar_spacing)) // 2
-        
-        for i in range(num_bars):
-            # Animate bars with different phases
-            phase = (i / num_bars) * 2 * 3.14159
-            amplitude = 0.3 + 0.7 * abs(np.sin(self.animation_value * 2 * 3.14159 + phase))
-            bar_height = int(20 * amplitude)
-            
-            x = start_x + i * (bar_width + bar_spacing)
-            y = center_y - bar_height // 2
-            
-            painter.drawRect(x, y, bar_width, bar_height)
+        painter.setPen(self._pen_bar)
+        
+        # Animate bars with different phases. math.sin on a Python float is
+        # cheaper than NumPy's dispatch for only a handful of bars.
+        t = self.animation_value * math.tau
+        sin = math.sin
+        center_y = self._bar_center_y
+        bar_width = self._bar_width
+        for x, phase in zip(self._bar_xs, self._phases):
+            bar_height = int(20 * (0.3 + 0.7 * abs(sin(t + phase))))
+            painter.drawRect(x, center_y - bar_height // 2, bar_width, bar_height)
     
     def set_listening(self, listening: bool):
         """Set listening state.
@@ -172,10 +201,12 @@ class DictationOverlay(QWidget):
         if listening:
             self.status_label.setText("Listening...")
             self.animation.start()
+            self._repaint_timer.start()
             self.show()
         else:
             self.status_label.setText("Processing...")
             self.animation.stop()
+            self._repaint_timer.stop()
             self.animation_value = 0.0
         self.update()
     
@@ -200,6 +231,7 @@ class DictationOverlay(QWidget):
         """Hide the overlay."""
         self.hide()
         self.animation.stop()
+        self._repaint_timer.stop()
         self.animation_value = 0.0
     
     def get_animation_value(self) -> float:
@@ -213,7 +245,6 @@ class DictationOverlay(QWidget):
             value: Animation value (0.0 to 1.0)
         """
         self.animation_value = value
-        self.update()
     
     animationValue = pyqtProperty(float, get_animation_value, set_animation_value)
 
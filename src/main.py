@@ -1,31 +1,13 @@
 """Main application entry point."""
 
 import sys
-import threading
-import time
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
-from PyQt6.QtCore import QTimer, QObject, pyqtSignal
-
-# #region agent log
-DEBUG_LOG_PATH = "/home/jb/dev/VocalNode/.cursor/debug.log"
-def _debug_log(session_id, run_id, hypothesis_id, location, message, data=None):
-    try:
-        with open(DEBUG_LOG_PATH, 'a') as f:
-            log_entry = {
-                "sessionId": session_id,
-                "runId": run_id,
-                "hypothesisId": hypothesis_id,
-                "location": location,
-                "message": message,
-                "data": data or {},
-                "timestamp": int(time.time() * 1000)
-            }
-            f.write(json.dumps(log_entry) + "\n")
-    except:
-        pass
-# #endregion
+from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal
 
+from .debug_log import DEBUG, VERBOSE as _VERBOSE, debug_log as _debug_log
 from .config import Config
 from .tray_icon import TrayIcon
 from .settings_window import SettingsWindow
@@ -39,10 +21,14 @@ from .text_inserter import TextInserter
 class VocalNodeApp(QObject):
     """Main application class."""
     
-    # Signals for thread-safe communication
-    text_ready = pyqtSignal(str)
-    processing_done = pyqtSignal()
-    show_message_signal = pyqtSignal(str, str, object)  # title, message, icon_type
+    # Posts a callable to run on the main thread. Worker threads hand all
+    # their UI work over in one emit rather than one signal per update.
+    _post = pyqtSignal(object)
+    
+    # Live preview: how often to re-transcribe while recording, and how much
+    # of the most recent audio each pass covers
+    PREVIEW_INTERVAL_MS = 1000
+    PREVIEW_SECONDS = 5
     
     def __init__(self):
         """Initialize the application."""
@@ -51,6 +37,7 @@ class VocalNodeApp(QObject):
         # Initialize components
         self.config = Config()
         self.audio_capture = AudioCapture(self.config)
+        self.audio_capture.on_buffer_full = self._on_audio_buffer_full
         self.stt_engine = STTEngine(self.config)
         self.text_inserter = TextInserter(self.config)
         
@@ -62,68 +49,86 @@ class VocalNodeApp(QObject):
         # State
         self.is_recording = False
         self.is_processing = False
-        self.audio_chunks = []
-        self.recording_thread = None
+        self._read_settings()
+        
+        # One long-lived worker runs model loading and transcription in order,
+        # instead of spawning a thread per operation
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vocalnode-worker")
+        
+        # Periodic partial transcription while recording (overlay.live_preview)
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setInterval(self.PREVIEW_INTERVAL_MS)
+        self._preview_timer.timeout.connect(self._schedule_preview)
+        self._preview_pending = False
         
-        # Setup hotkey manager
+        # Setup hotkey manager. Its callbacks fire on a pynput thread, so
+        # hand them to the main thread, which owns the overlay and tray.
         self.hotkey_manager = HotkeyManager(
             self.config,
-            on_press=self.start_dictation,
-            on_release=self.stop_dictation
+            on_press=partial(self._post.emit, self.start_dictation),
+            on_release=partial(self._post.emit, self.stop_dictation)
         )
         
-        # Connect signals
-        self.tray_icon.show_settings.connect(self.show_settings)
-        self.tray_icon.toggle_dictation.connect(self.toggle_dictation)
-        self.tray_icon.quit_app.connect(self.quit_application)
-        self.text_ready.connect(self._insert_text)
-        # #region agent log
-        _debug_log("debug-session", "run1", "H4", "main.py:__init__:signal_connect", "text_ready signal connected", {"handler": "_insert_text"})
-        # #endregion
-        self.processing_done.connect(self._on_processing_done)
-        # #region agent log
-        _debug_log("debug-session", "run1", "H4", "main.py:__init__:signal_connect", "processing_done signal connected", {"handler": "_on_processing_done"})
-        # #endregion
-        self.show_message_signal.connect(self._show_message)
-        # #region agent log
-        _debug_log("debug-session", "run1", "H4", "main.py:__init__:signal_connect", "show_message_signal connected", {"handler": "_show_message"})
-        # #endregion
+        # Connect signals. _post is only emitted from other threads; the
+        # tray signals come from menu actions on the main thread, so call
+        # their slots directly instead of going through the event queue.
+        direct = Qt.ConnectionType.DirectConnection
+        self.tray_icon.show_settings.connect(self.show_settings, direct)
+        self.tray_icon.toggle_dictation.connect(self.toggle_dictation, direct)
+        self.tray_icon.quit_app.connect(self.quit_application, direct)
+        self._post.connect(self._run_posted, Qt.ConnectionType.QueuedConnection)
         
         # Start hotkey listener
         # #region agent log
-        _debug_log("debug-session", "run1", "H1", "main.py:__init__:before_hotkey_start", "Before starting hotkey manager")
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H1", "main.py:__init__:before_hotkey_start", "Before starting hotkey manager")
         # #endregion
         hotkey_start_result = self.hotkey_manager.start()
         # #region agent log
-        _debug_log("debug-session", "run1", "H1", "main.py:__init__:after_hotkey_start", "After starting hotkey manager", {"result": hotkey_start_result, "listener_exists": self.hotkey_manager.listener is not None})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H1", "main.py:__init__:after_hotkey_start", "After starting hotkey manager", {"result": hotkey_start_result, "listener_exists": self.hotkey_manager.listener is not None})
         # #endregion
         
         # Load STT model in background
         self.load_model_async()
     
+    def _read_settings(self):
+        """Cache settings read on every dictation; refreshed when settings close."""
+        self._overlay_enabled = self.config.get("overlay.enabled", True)
+        self._sample_rate = self.config.get("audio.sample_rate", 16000)
+        self._live_preview = self._overlay_enabled and self.config.get("overlay.live_preview", False)
+    
     def load_model_async(self):
-        """Load STT model in background thread."""
+        """Load STT model on the background worker."""
         def load():
             try:
-                self.stt_engine.load_model()
-                self.show_message_signal.emit(
-                    "VocalNode",
-                    "Model loaded successfully",
-                    self.tray_icon.tray_icon.MessageIcon.Information
-                )
+                if not self.stt_engine.load_model():
+                    self._post_message("Error loading model", QSystemTrayIcon.MessageIcon.Critical)
+                    return
+                # Report ready only once the first inference has been paid for
+                self.stt_engine.warmup()
+                self._post_message("Model loaded successfully", QSystemTrayIcon.MessageIcon.Information)
             except Exception as e:
-                self.show_message_signal.emit(
-                    "VocalNode",
-                    f"Error loading model: {e}",
-                    self.tray_icon.tray_icon.MessageIcon.Critical
-                )
+                self._post_message(f"Error loading model: {e}", QSystemTrayIcon.MessageIcon.Critical)
         
-        thread = threading.Thread(target=load, daemon=True)
-        thread.start()
+        self._worker.submit(load)
+    
+    def _on_audio_buffer_full(self):
+        """End a recording that filled the capture buffer (runs on the capture thread)."""
+        # Transcribe what was kept rather than silently losing the rest
+        self._post_message(
+            "Recording stopped: reached the audio.max_seconds limit",
+            QSystemTrayIcon.MessageIcon.Warning
+        )
+        self._post.emit(self.stop_dictation)
     
-    def _show_message(self, title: str, message: str, icon_type: int):
-        """Show message (runs on main thread)."""
-        self.tray_icon.show_message(title, message, icon_type)
+    def _run_posted(self, fn: Callable):
+        """Run a callable posted from another thread (runs on main thread)."""
+        fn()
+    
+    def _post_message(self, message: str, icon_type):
+        """Show a tray message from any thread."""
+        self._post.emit(partial(self.tray_icon.show_message, "VocalNode", message, icon_type))
     
     def show_settings(self):
         """Show settings window."""
@@ -133,7 +138,7 @@ class VocalNodeApp(QObject):
                 self.audio_capture,
                 self.stt_engine
             )
-            self.settings_window.closed.connect(self.on_settings_closed)
+            self.settings_window.closed.connect(self.on_settings_closed, Qt.ConnectionType.DirectConnection)
         
         self.settings_window.show()
         self.settings_window.raise_()
@@ -141,17 +146,27 @@ class VocalNodeApp(QObject):
     
     def on_settings_closed(self):
         """Handle settings window closed."""
-        # Settings are saved automatically, but we may need to restart hotkey listener
-        self.hotkey_manager.stop()
-        self.hotkey_manager = HotkeyManager(
-            self.config,
-            on_press=self.start_dictation,
-            on_release=self.stop_dictation
-        )
-        self.hotkey_manager.start()
+        # Settings are saved automatically; restart the hotkey listener only
+        # if the binding actually changed
+        self.hotkey_manager.reload_if_changed()
         
         # Update overlay position if changed
-        self.overlay.update_position()
+        self.overlay.apply_config()
+        self._read_settings()
+        
+        # Switching models or their device/compute settings may load weights
+        # from disk; keep it off the main thread, queued behind any
+        # transcription already running. A no-op if nothing changed.
+        self._worker.submit(self._switch_model, self.config.get("stt.model", "base"))
+    
+    def _switch_model(self, model: str):
+        """Apply the STT model and backend settings (runs on the background worker)."""
+        try:
+            self.stt_engine.reload_backend()
+            if not self.stt_engine.set_model(model):
+                self._post_message(f"Error loading model: {model}", QSystemTrayIcon.MessageIcon.Critical)
+        except Exception as e:
+            self._post_message(f"Error loading model: {e}", QSystemTrayIcon.MessageIcon.Critical)
     
     def toggle_dictation(self):
         """Toggle dictation on/off."""
@@ -163,75 +178,67 @@ class VocalNodeApp(QObject):
     def start_dictation(self):
         """Start dictation."""
         # #region agent log
-        _debug_log("debug-session", "run1", "H4", "main.py:start_dictation:entry", "start_dictation called", {"is_recording": self.is_recording, "is_processing": self.is_processing})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H4", "main.py:start_dictation:entry", "start_dictation called", {"is_recording": self.is_recording, "is_processing": self.is_processing})
         # #endregion
         if self.is_recording or self.is_processing:
-            print("Already recording or processing, ignoring start request")
+            if _VERBOSE:
+                print("Already recording or processing, ignoring start request")
             # #region agent log
-            _debug_log("debug-session", "run1", "H4", "main.py:start_dictation:early_return", "Early return - already recording/processing")
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H4", "main.py:start_dictation:early_return", "Early return - already recording/processing")
             # #endregion
             return
         
         try:
-            print("Starting dictation...")
-            # #region agent log
-            _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:before_set", "Before setting is_recording", {"audio_chunks_count": len(self.audio_chunks)})
-            # #endregion
+            if _VERBOSE:
+                print("Starting dictation...")
             self.is_recording = True
-            self.audio_chunks = []
-            # #region agent log
-            _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:after_set", "After setting is_recording", {"is_recording": self.is_recording, "audio_chunks_cleared": True})
-            # #endregion
             
             # Start audio capture
             # #region agent log
-            _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:before_audio_start", "Before audio_capture.start_recording", {"device_id": self.audio_capture.device_id})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:before_audio_start", "Before audio_capture.start_recording", {"device_id": self.audio_capture.device_id})
             # #endregion
             audio_start_result = self.audio_capture.start_recording()
             # #region agent log
-            _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:after_audio_start", "After audio_capture.start_recording", {"result": audio_start_result, "is_recording": self.audio_capture.is_recording})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:after_audio_start", "After audio_capture.start_recording", {"result": audio_start_result, "is_recording": self.audio_capture.is_recording})
             # #endregion
             if not audio_start_result:
                 print("Failed to start audio capture")
                 # #region agent log
-                _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:audio_failed", "Audio capture failed to start")
+                if DEBUG:
+                    _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:audio_failed", "Audio capture failed to start")
                 # #endregion
-                from PyQt6.QtWidgets import QSystemTrayIcon
-                self.show_message_signal.emit(
-                    "VocalNode",
+                self._post_message(
                     "Failed to start audio capture. Check microphone permissions.",
                     QSystemTrayIcon.MessageIcon.Warning
                 )
                 self.is_recording = False
                 return
             
-            print("Audio capture started successfully")
+            if _VERBOSE:
+                print("Audio capture started successfully")
             # #region agent log
-            _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:audio_success", "Audio capture started successfully")
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:audio_success", "Audio capture started successfully")
             # #endregion
             
             # Show overlay
-            overlay_enabled = self.config.get("overlay.enabled", True)
-            if overlay_enabled:
+            if self._overlay_enabled:
                 self.overlay.set_listening(True)
+            if self._live_preview:
+                self._preview_timer.start()
             
             # Update tray icon
             self.tray_icon.update_state(True, False)
             
-            # Start recording thread
-            # #region agent log
-            _debug_log("debug-session", "run1", "H6", "main.py:start_dictation:before_thread", "Before starting recording thread")
-            # #endregion
-            self.recording_thread = threading.Thread(target=self._recording_loop, daemon=True)
-            self.recording_thread.start()
-            # #region agent log
-            _debug_log("debug-session", "run1", "H6", "main.py:start_dictation:thread_started", "Recording thread started", {"thread_alive": self.recording_thread.is_alive()})
-            # #endregion
-            
         except Exception as e:
             print(f"Error starting dictation: {e}")
             # #region agent log
-            _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:exception", "Exception in start_dictation", {"error": str(e), "type": type(e).__name__})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H2", "main.py:start_dictation:exception", "Exception in start_dictation", {"error": str(e), "type": type(e).__name__})
             # #endregion
             self.is_recording = False
             self.audio_capture.stop_recording()
@@ -239,23 +246,31 @@ class VocalNodeApp(QObject):
     def stop_dictation(self):
         """Stop dictation and process audio."""
         # #region agent log
-        _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:entry", "stop_dictation called", {"is_recording": self.is_recording})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:entry", "stop_dictation called", {"is_recording": self.is_recording})
         # #endregion
         if not self.is_recording:
-            print("Not recording, ignoring stop request")
+            if _VERBOSE:
+                print("Not recording, ignoring stop request")
             # #region agent log
-            _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:early_return", "Early return - not recording")
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:early_return", "Early return - not recording")
             # #endregion
             return
         
-        print("Stopping dictation...")
+        if _VERBOSE:
+            print("Stopping dictation...")
         # #region agent log
-        _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:before_stop", "Before stopping", {"audio_chunks_count": len(self.audio_chunks), "queue_size": self.audio_capture.audio_queue.qsize() if hasattr(self.audio_capture, 'audio_queue') else 'N/A'})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:before_stop", "Before stopping", {"is_processing": self.is_processing})
         # #endregion
         self.is_recording = False
         self.is_processing = True
+        if self._live_preview:
+            self._preview_timer.stop()
         # #region agent log
-        _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:after_stop", "After stopping", {"is_recording": self.is_recording, "is_processing": self.is_processing})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:after_stop", "After stopping", {"is_recording": self.is_recording, "is_processing": self.is_processing})
         # #endregion
         
         # Reset hotkey pressed state for toggle mode
@@ -264,12 +279,13 @@ class VocalNodeApp(QObject):
         
         # Stop audio capture
         # #region agent log
-        _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:before_audio_stop", "Before audio_capture.stop_recording", {"audio_chunks_before": len(self.audio_chunks)})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:before_audio_stop", "Before audio_capture.stop_recording")
         # #endregion
         self.audio_capture.stop_recording()
-        print(f"Collected {len(self.audio_chunks)} audio chunks")
         # #region agent log
-        _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:after_audio_stop", "After audio_capture.stop_recording", {"audio_chunks_after": len(self.audio_chunks), "audio_capture_is_recording": self.audio_capture.is_recording})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H2", "main.py:stop_dictation:after_audio_stop", "After audio_capture.stop_recording", {"audio_capture_is_recording": self.audio_capture.is_recording})
         # #endregion
         
         # Update overlay
@@ -281,173 +297,183 @@ class VocalNodeApp(QObject):
         
         # Process audio in background
         # #region agent log
-        _debug_log("debug-session", "run1", "H3", "main.py:stop_dictation:before_process_thread", "Before starting processing thread")
-        # #endregion
-        processing_thread = threading.Thread(target=self._process_audio, daemon=True)
-        processing_thread.start()
-        # #region agent log
-        _debug_log("debug-session", "run1", "H3", "main.py:stop_dictation:process_thread_started", "Processing thread started", {"thread_alive": processing_thread.is_alive()})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H3", "main.py:stop_dictation:before_process", "Before queuing audio processing")
         # #endregion
+        self._worker.submit(self._process_audio)
     
-    def _recording_loop(self):
-        """Main recording loop - collects audio chunks."""
-        # #region agent log
-        _debug_log("debug-session", "run1", "H6", "main.py:_recording_loop:entry", "Recording loop started", {"is_recording": self.is_recording})
-        # #endregion
-        loop_count = 0
-        chunks_collected = 0
-        while self.is_recording:
-            loop_count += 1
-            # #region agent log
-            if loop_count % 10 == 0:  # Log every 10 iterations to avoid spam
-                _debug_log("debug-session", "run1", "H6", "main.py:_recording_loop:iteration", "Recording loop iteration", {"loop_count": loop_count, "chunks_collected": chunks_collected, "is_recording": self.is_recording})
-            # #endregion
-            chunk = self.audio_capture.get_audio_chunk(timeout=0.5)
-            if chunk is not None:
-                chunks_collected += 1
-                # #region agent log
-                _debug_log("debug-session", "run1", "H6", "main.py:_recording_loop:chunk_received", "Chunk received", {"chunk_size": len(chunk), "chunks_collected": chunks_collected})
-                # #endregion
-                self.audio_chunks.append(chunk)
-            time.sleep(0.1)
-        # #region agent log
-        _debug_log("debug-session", "run1", "H6", "main.py:_recording_loop:exit", "Recording loop exited", {"total_iterations": loop_count, "total_chunks": chunks_collected, "final_chunks_count": len(self.audio_chunks)})
-        # #endregion
+    def _schedule_preview(self):
+        """Queue a partial transcription of the latest audio (runs on main thread)."""
+        # Skip a tick rather than pile up passes when STT is slower than the timer
+        if self._preview_pending or not self.is_recording:
+            return
+        self._preview_pending = True
+        self._worker.submit(self._preview_audio)
+    
+    def _preview_audio(self):
+        """Transcribe the recent window for the overlay (runs on the background worker).
+        
+        Reads without consuming, so the final pass in _process_audio still
+        sees the whole recording. It runs on the same worker, so it always
+        comes after any preview still in progress.
+        """
+        try:
+            audio = self.audio_capture.get_recent_audio(self._sample_rate * self.PREVIEW_SECONDS)
+            if audio.size < self._sample_rate // 2:
+                return
+            text = self.stt_engine.transcribe_audio(audio, self._sample_rate)
+            if text:
+                self._post.emit(partial(self._show_preview, text))
+        except Exception as e:
+            print(f"Error in live preview: {e}")
+        finally:
+            self._preview_pending = False
+    
+    def _show_preview(self, text: str):
+        """Show partial text unless recording already ended (runs on main thread)."""
+        if self.is_recording:
+            self.overlay.set_text(text)
     
     def _process_audio(self):
-        """Process recorded audio and insert text."""
+        """Process recorded audio and insert text (runs on the background worker)."""
         # #region agent log
-        _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:entry", "Processing audio started", {"audio_chunks_count": len(self.audio_chunks)})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:entry", "Processing audio started")
         # #endregion
         try:
-            import numpy as np
-            
-            # Get audio from queue first (most reliable)
             # #region agent log
-            _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:before_get_audio", "Before get_all_audio", {"queue_size": self.audio_capture.audio_queue.qsize() if hasattr(self.audio_capture, 'audio_queue') else 'N/A'})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:before_get_audio", "Before get_all_audio")
             # #endregion
-            audio = self.audio_capture.get_all_audio()
+            # Everything captured since start_recording is still in the ring.
+            # Take a view rather than a copy: start_dictation refuses to start
+            # a new recording (which would overwrite it) while is_processing.
+            audio = self.audio_capture.get_all_audio(copy=False)
+            n = audio.size
+            sample_rate = self._sample_rate
             # #region agent log
-            _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:after_get_audio", "After get_all_audio", {"audio_length": len(audio), "audio_dtype": str(audio.dtype) if len(audio) > 0 else "empty"})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:after_get_audio", "After get_all_audio", {"audio_length": n, "audio_dtype": str(audio.dtype) if n else "empty"})
             # #endregion
             
-            # Fallback: use collected chunks if queue is empty
-            if len(audio) == 0 and self.audio_chunks:
-                print(f"Using fallback: {len(self.audio_chunks)} chunks")
-                # #region agent log
-                _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:using_fallback", "Using fallback chunks", {"chunks_count": len(self.audio_chunks)})
-                # #endregion
-                audio = np.concatenate(self.audio_chunks) if self.audio_chunks else np.array([], dtype=np.float32)
-                # #region agent log
-                _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:after_fallback", "After fallback concatenation", {"audio_length": len(audio)})
-                # #endregion
-            
-            print(f"Processing audio: {len(audio)} samples, duration: {len(audio)/16000:.2f}s")
+            if _VERBOSE:
+                print(f"Processing audio: {n} samples, duration: {n / sample_rate:.2f}s")
             # #region agent log
-            _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:audio_ready", "Audio ready for processing", {"samples": len(audio), "duration_sec": len(audio)/16000 if len(audio) > 0 else 0})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:audio_ready", "Audio ready for processing", {"samples": n, "duration_sec": n / sample_rate})
             # #endregion
             
-            if len(audio) == 0:
-                print("No audio data to process")
-                self.processing_done.emit()
-                return
-            
-            # Ensure minimum audio length (at least 0.5 seconds)
-            if len(audio) < 8000:  # Less than 0.5 seconds at 16kHz
-                print(f"Audio too short: {len(audio)} samples")
-                self.processing_done.emit()
+            # Require at least 0.5 seconds of audio
+            if n < sample_rate // 2:
+                if _VERBOSE:
+                    print(f"Audio too short: {n} samples" if n else "No audio data to process")
+                self._post.emit(partial(self._finish_ui, ""))
                 return
             
             # Transcribe
-            sample_rate = self.config.get("audio.sample_rate", 16000)
-            print(f"Transcribing audio with sample rate: {sample_rate}")
+            if _VERBOSE:
+                print(f"Transcribing audio with sample rate: {sample_rate}")
             # #region agent log
-            _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:before_transcribe", "Before transcription", {"sample_rate": sample_rate, "audio_shape": audio.shape if len(audio) > 0 else "empty", "audio_max": float(np.max(np.abs(audio))) if len(audio) > 0 else 0})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:before_transcribe", "Before transcription", {"sample_rate": sample_rate, "samples": n})
             # #endregion
-            text = self.stt_engine.transcribe_audio(audio, sample_rate)
-            print(f"Transcribed text: '{text}'")
+            # Insert each segment as soon as it is decoded, so typing the
+            # start of a long utterance overlaps decoding the rest. This runs
+            # here rather than on the main thread: the inserter only drives
+            # pynput/pyperclip, and typing can take a while. Typing or
+            # pasting is decided once, from the first segment, and used for
+            # the whole dictation.
+            results = []
+            method = None
+            
+            def insert_segment(part: str):
+                nonlocal method
+                if method is None:
+                    method = self.text_inserter.choose_method(part)
+                if _VERBOSE:
+                    print(f"Inserting text: '{part[:50]}...'")
+                results.append(self._insert_text(" " + part if results else part, restore_clipboard=False, method=method))
+            
+            try:
+                text = self.stt_engine.transcribe_audio_iter(audio, sample_rate, on_segment=insert_segment)
+            finally:
+                # Restore the user's clipboard once, after the last paste
+                self.text_inserter.restore_clipboard()
+            if _VERBOSE:
+                print(f"Transcribed text: '{text}'")
             # #region agent log
-            _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:after_transcribe", "After transcription", {"text": text, "text_length": len(text) if text else 0})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:after_transcribe", "After transcription", {"text": text, "text_length": len(text) if text else 0, "segments": len(results)})
             # #endregion
             
-            # Update overlay with transcribed text
-            overlay_enabled = self.config.get("overlay.enabled", True)
-            if overlay_enabled:
-                self.overlay.set_text(text)
-            
-            # Insert text into active window
-            if text and text.strip():
-                print(f"Inserting text: '{text[:50]}...'")
-                # #region agent log
-                _debug_log("debug-session", "run1", "H4", "main.py:_process_audio:before_emit_text", "Before emitting text_ready signal", {"text_preview": text[:50]})
-                # #endregion
-                # Emit signal to run on main thread
-                self.text_ready.emit(text)
-                # #region agent log
-                _debug_log("debug-session", "run1", "H4", "main.py:_process_audio:after_emit_text", "After emitting text_ready signal")
-                # #endregion
-            else:
+            inserted = all(results) if results else None
+            if inserted is None and _VERBOSE:
                 print("No text transcribed or empty text")
-                # #region agent log
-                _debug_log("debug-session", "run1", "H3", "main.py:_process_audio:no_text", "No text to insert", {"text": text, "text_is_empty": not (text and text.strip())})
-                # #endregion
-                self.processing_done.emit()
+            
+            # Overlay, notification and state reset happen in one hop to the
+            # main thread
+            self._post.emit(partial(self._finish_ui, text, inserted))
         
         except Exception as e:
             print(f"Error processing audio: {e}")
-            from PyQt6.QtWidgets import QSystemTrayIcon
-            self.show_message_signal.emit(
-                "VocalNode",
-                f"Error processing audio: {e}",
-                QSystemTrayIcon.MessageIcon.Critical
-            )
-            self.processing_done.emit()
+            self._post.emit(partial(self._finish_ui, "", error=f"Error processing audio: {e}"))
     
-    def _insert_text(self, text: str):
-        """Insert text into active window (runs on main thread)."""
-        # #region agent log
-        _debug_log("debug-session", "run1", "H4", "main.py:_insert_text:entry", "Text insertion handler called", {"text_length": len(text), "text_preview": text[:50]})
-        # #endregion
-        from PyQt6.QtWidgets import QSystemTrayIcon
-        # #region agent log
-        _debug_log("debug-session", "run1", "H5", "main.py:_insert_text:before_insert", "Before text_inserter.insert_text", {"method": self.text_inserter.method})
-        # #endregion
-        success = self.text_inserter.insert_text(text)
+    def _finish_ui(self, text: str, inserted: Optional[bool] = None, error: Optional[str] = None):
+        """Show the result of processing and reset state (runs on main thread).
+        
+        Args:
+            text: Transcribed text, empty if nothing was recognized
+            inserted: Whether inserting the text succeeded, None if not attempted
+            error: Error message to report instead of a result
+        """
+        if error:
+            self.tray_icon.show_message("VocalNode", error, QSystemTrayIcon.MessageIcon.Critical)
+        else:
+            # Update overlay with transcribed text
+            if self._overlay_enabled:
+                self.overlay.set_text(text)
+            
+            if inserted:
+                self.tray_icon.show_message(
+                    "VocalNode",
+                    f"Inserted: {text[:50]}...",
+                    QSystemTrayIcon.MessageIcon.Information
+                )
+            elif inserted is not None:
+                self.tray_icon.show_message(
+                    "VocalNode",
+                    "Failed to insert text",
+                    QSystemTrayIcon.MessageIcon.Warning
+                )
+        
+        self.is_processing = False
+        self.tray_icon.update_state(False, False)
+        if self._overlay_enabled:
+            QTimer.singleShot(2000, self.overlay.hide_overlay)
         # #region agent log
-        _debug_log("debug-session", "run1", "H5", "main.py:_insert_text:after_insert", "After text_inserter.insert_text", {"success": success})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H4", "main.py:_finish_ui:exit", "Processing finished", {"text_length": len(text), "error": error})
         # #endregion
-        if success:
-            self.tray_icon.show_message(
-                "VocalNode",
-                f"Inserted: {text[:50]}...",
-                QSystemTrayIcon.MessageIcon.Information
-            )
-        else:
-            self.tray_icon.show_message(
-                "VocalNode",
-                "Failed to insert text",
-                QSystemTrayIcon.MessageIcon.Warning
-            )
-        self.processing_done.emit()
     
-    def _on_processing_done(self):
-        """Handle processing completion (runs on main thread)."""
+    def _insert_text(self, text: str, restore_clipboard: bool = True, method: Optional[str] = None) -> bool:
+        """Insert text into active window (runs on the background worker)."""
         # #region agent log
-        _debug_log("debug-session", "run1", "H4", "main.py:_on_processing_done:entry", "Processing done handler called")
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H5", "main.py:_insert_text:before_insert", "Before text_inserter.insert_text", {"method": self.text_inserter.method, "text_length": len(text)})
         # #endregion
-        self.is_processing = False
-        self.tray_icon.update_state(False, False)
-        overlay_enabled = self.config.get("overlay.enabled", True)
-        if overlay_enabled:
-            QTimer.singleShot(2000, self.overlay.hide_overlay)
+        success = self.text_inserter.insert_text(text, restore_clipboard, method)
         # #region agent log
-        _debug_log("debug-session", "run1", "H4", "main.py:_on_processing_done:exit", "Processing done handler completed", {"is_processing": self.is_processing})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H5", "main.py:_insert_text:after_insert", "After text_inserter.insert_text", {"success": success})
         # #endregion
+        return success
     
     def quit_application(self):
         """Quit the application."""
         self.hotkey_manager.stop()
-        self.audio_capture.stop_recording()
+        self._worker.shutdown(wait=False, cancel_futures=True)
+        self.audio_capture.close()
+        self.config.flush()
         QApplication.quit()
 
 
@@ -9,6 +9,83 @@ from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QKeySequence, QKeyEvent
 from typing import Optional
 
+from .hotkey_manager import normalize_key
+
+# Qt key codes with a fixed hotkey name, built once at import
+_SPECIAL_KEYS = {
+    key.value: name for key, name in (
+        (Qt.Key.Key_F1, "f1"), (Qt.Key.Key_F2, "f2"), (Qt.Key.Key_F3, "f3"),
+        (Qt.Key.Key_F4, "f4"), (Qt.Key.Key_F5, "f5"), (Qt.Key.Key_F6, "f6"),
+        (Qt.Key.Key_F7, "f7"), (Qt.Key.Key_F8, "f8"), (Qt.Key.Key_F9, "f9"),
+        (Qt.Key.Key_F10, "f10"), (Qt.Key.Key_F11, "f11"), (Qt.Key.Key_F12, "f12"),
+        (Qt.Key.Key_Space, "space"),
+        (Qt.Key.Key_Insert, "insert"), (Qt.Key.Key_Delete, "delete"),
+        (Qt.Key.Key_Home, "home"), (Qt.Key.Key_End, "end"),
+        (Qt.Key.Key_PageUp, "page_up"), (Qt.Key.Key_PageDown, "page_down"),
+        (Qt.Key.Key_Up, "up"), (Qt.Key.Key_Down, "down"),
+        (Qt.Key.Key_Left, "left"), (Qt.Key.Key_Right, "right"),
+        (Qt.Key.Key_Enter, "enter"), (Qt.Key.Key_Return, "return"),
+        (Qt.Key.Key_Tab, "tab"), (Qt.Key.Key_Backspace, "backspace"),
+        (Qt.Key.Key_Escape, "escape"),
+    )
+}
+_KEY_A, _KEY_Z = Qt.Key.Key_A.value, Qt.Key.Key_Z.value
+_KEY_0, _KEY_9 = Qt.Key.Key_0.value, Qt.Key.Key_9.value
+_ORD_LOWER_A, _ORD_UPPER_A, _ORD_0 = ord('a'), ord('A'), ord('0')
+
+# Common languages offered in the STT tab, with their display strings and
+# combo positions precomputed
+_LANGUAGES = (
+    ("auto", "Auto-detect"),
+    ("en", "English"),
+    ("es", "Spanish"),
+    ("fr", "French"),
+    ("de", "German"),
+    ("it", "Italian"),
+    ("pt", "Portuguese"),
+    ("ru", "Russian"),
+    ("ja", "Japanese"),
+    ("zh", "Chinese"),
+    ("ko", "Korean"),
+)
+_LANG_DISPLAY = tuple(f"{name} ({code})" for code, name in _LANGUAGES)
+_LANG_INDEX = {code: i for i, (code, _) in enumerate(_LANGUAGES)}
+
+
+class KeyCaptureButton(QPushButton):
+    """Button that reports the next key press while capture is active.
+    
+    Capture grabs the keyboard for this widget only, so key presses reach
+    its keyPressEvent without filtering every application event in Python.
+    """
+    
+    key_captured = pyqtSignal(int, object)  # Qt key code, keyboard modifiers
+    
+    def __init__(self, text: str, parent: Optional[QWidget] = None):
+        super().__init__(text, parent)
+        self.capturing = False
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+    
+    def start_capture(self):
+        """Route keyboard input to this button until stop_capture()."""
+        self.capturing = True
+        self.setFocus()
+        self.grabKeyboard()
+    
+    def stop_capture(self):
+        """Release the keyboard grab."""
+        if self.capturing:
+            self.capturing = False
+            self.releaseKeyboard()
+    
+    def keyPressEvent(self, event: QKeyEvent):
+        """Report key presses while capturing; otherwise behave as a button."""
+        if self.capturing:
+            event.accept()
+            self.key_captured.emit(event.key(), event.modifiers())
+            return
+        super().keyPressEvent(event)
+
 
 class SettingsWindow(QWidget):
     """Settings window for configuring the application."""
@@ -37,26 +114,23 @@ class SettingsWindow(QWidget):
         
         layout = QVBoxLayout()
         
-        # Create tabs
-        tabs = QTabWidget()
-        
-        # Hotkey tab
-        hotkey_tab = self.create_hotkey_tab()
-        tabs.addTab(hotkey_tab, "Hotkey")
-        
-        # Audio tab
-        audio_tab = self.create_audio_tab()
-        tabs.addTab(audio_tab, "Audio")
-        
-        # Speech-to-Text tab
-        stt_tab = self.create_stt_tab()
-        tabs.addTab(stt_tab, "Speech-to-Text")
-        
-        # Overlay tab
-        overlay_tab = self.create_overlay_tab()
-        tabs.addTab(overlay_tab, "Overlay")
+        # Create tabs. Each is built the first time it is shown, so opening
+        # the window costs one tab's widgets and no device enumeration until
+        # the Audio tab is visited.
+        self.tabs = QTabWidget()
+        self._tab_builders = [
+            ("Hotkey", self.create_hotkey_tab, self._load_hotkey_settings),
+            ("Audio", self.create_audio_tab, self._load_audio_settings),
+            ("Speech-to-Text", self.create_stt_tab, self._load_stt_settings),
+            ("Overlay", self.create_overlay_tab, self._load_overlay_settings),
+        ]
+        self._built_tabs = set()
+        for title, _, _ in self._tab_builders:
+            self.tabs.addTab(QWidget(), title)
+        self._build_tab(0)
+        self.tabs.currentChanged.connect(self._on_tab_activated)
         
-        layout.addWidget(tabs)
+        layout.addWidget(self.tabs)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -71,13 +145,30 @@ class SettingsWindow(QWidget):
         layout.addLayout(button_layout)
         self.setLayout(layout)
     
+    def _build_tab(self, index: int) -> None:
+        """Replace a placeholder tab with its real widgets."""
+        title, create, _ = self._tab_builders[index]
+        self._built_tabs.add(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, create(), title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+    
+    def _on_tab_activated(self, index: int):
+        """Build a tab on first activation and load its settings."""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._build_tab(index)
+        self._tab_builders[index][2]()
+    
     def create_hotkey_tab(self) -> QWidget:
         """Create hotkey configuration tab."""
         widget = QWidget()
         layout = QFormLayout()
         
         # Key capture button
-        self.key_capture_button = QPushButton("Click here and press your hotkey")
+        self.key_capture_button = KeyCaptureButton("Click here and press your hotkey")
         self.key_capture_button.setMinimumHeight(40)
         self.key_capture_button.setStyleSheet("""
             QPushButton {
@@ -95,7 +186,7 @@ class SettingsWindow(QWidget):
             }
         """)
         self.key_capture_button.clicked.connect(self.start_key_capture)
-        self.capturing_key = False
+        self.key_capture_button.key_captured.connect(self._on_key_captured)
         self.captured_key = None
         self.captured_modifiers = []
         
@@ -141,7 +232,6 @@ class SettingsWindow(QWidget):
     
     def start_key_capture(self):
         """Start capturing key press."""
-        self.capturing_key = True
         self.key_capture_button.setText("Press your hotkey now...")
         self.key_capture_button.setStyleSheet("""
             QPushButton {
@@ -154,110 +244,69 @@ class SettingsWindow(QWidget):
                 font-weight: bold;
             }
         """)
-        # Ensure window is active and focused
+        # Ensure window is active, then grab the keyboard for the button
         self.raise_()
         self.activateWindow()
-        self.setFocus()
-        self.key_capture_button.setFocus()
-        # Install event filter to capture keys
-        # Install on the application to catch all key events
-        from PyQt6.QtWidgets import QApplication
-        QApplication.instance().installEventFilter(self)
+        self.key_capture_button.start_capture()
         print("[DEBUG] Key capture started - press any key now")
     
-    def eventFilter(self, obj, event):
-        """Filter events to capture key presses."""
-        if self.capturing_key and event.type() == event.Type.KeyPress:
-            key = event.key()
-            modifiers = event.modifiers()
-            
-            print(f"[DEBUG] Key captured: key={key}, modifiers={modifiers}")
-            
-            # Convert Qt key to string representation
-            key_str = self._qt_key_to_string(key, modifiers)
-            
-            print(f"[DEBUG] Converted to string: {key_str}")
-            
-            if key_str:
-                self.captured_key = key_str
-                self.captured_modifiers = []
-                
-                # Extract modifiers
-                if modifiers & Qt.KeyboardModifier.ControlModifier:
-                    self.captured_modifiers.append("ctrl")
-                if modifiers & Qt.KeyboardModifier.AltModifier:
-                    self.captured_modifiers.append("alt")
-                if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                    self.captured_modifiers.append("shift")
-                if modifiers & Qt.KeyboardModifier.MetaModifier:
-                    self.captured_modifiers.append("cmd")
-                
-                # Update display
-                mod_str = "+".join([m.capitalize() for m in self.captured_modifiers])
-                display = f"{mod_str}+{key_str}" if mod_str else key_str
-                self.current_hotkey_label.setText(f"Current: {display}")
-                self.key_capture_button.setText("Click to change hotkey")
-                self.key_capture_button.setStyleSheet("""
-                    QPushButton {
-                        font-size: 14px;
-                        padding: 10px;
-                        background-color: #f0f0f0;
-                        border: 2px solid #ccc;
-                        border-radius: 5px;
-                    }
-                    QPushButton:hover {
-                        background-color: #e0e0e0;
-                    }
-                """)
-                self.capturing_key = False
-                # Remove event filter from application
-                from PyQt6.QtWidgets import QApplication
-                QApplication.instance().removeEventFilter(self)
-                print(f"[DEBUG] Key capture complete: {display}")
-                return True
-        
-        return super().eventFilter(obj, event)
+    def _on_key_captured(self, key: int, modifiers):
+        """Record a key pressed on the capture button."""
+        print(f"[DEBUG] Key captured: key={key}, modifiers={modifiers}")
+        
+        # Convert Qt key to string representation
+        key_str = self._qt_key_to_string(key, modifiers)
+        
+        print(f"[DEBUG] Converted to string: {key_str}")
+        
+        if not key_str:
+            return
+        
+        self.captured_key = key_str
+        self.captured_modifiers = []
+        
+        # Extract modifiers
+        if modifiers & Qt.KeyboardModifier.ControlModifier:
+            self.captured_modifiers.append("ctrl")
+        if modifiers & Qt.KeyboardModifier.AltModifier:
+            self.captured_modifiers.append("alt")
+        if modifiers & Qt.KeyboardModifier.ShiftModifier:
+            self.captured_modifiers.append("shift")
+        if modifiers & Qt.KeyboardModifier.MetaModifier:
+            self.captured_modifiers.append("cmd")
+        
+        # Update display
+        mod_str = "+".join([m.capitalize() for m in self.captured_modifiers])
+        display = f"{mod_str}+{key_str}" if mod_str else key_str
+        self.current_hotkey_label.setText(f"Current: {display}")
+        self.key_capture_button.setText("Click to change hotkey")
+        self.key_capture_button.setStyleSheet("""
+            QPushButton {
+                font-size: 14px;
+                padding: 10px;
+                background-color: #f0f0f0;
+                border: 2px solid #ccc;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #e0e0e0;
+            }
+        """)
+        self.key_capture_button.stop_capture()
+        print(f"[DEBUG] Key capture complete: {display}")
     
     def _qt_key_to_string(self, key, modifiers):
         """Convert Qt key code to string representation."""
-        # Handle special keys
-        special_keys = {
-            Qt.Key.Key_F1: "f1", Qt.Key.Key_F2: "f2", Qt.Key.Key_F3: "f3",
-            Qt.Key.Key_F4: "f4", Qt.Key.Key_F5: "f5", Qt.Key.Key_F6: "f6",
-            Qt.Key.Key_F7: "f7", Qt.Key.Key_F8: "f8", Qt.Key.Key_F9: "f9",
-            Qt.Key.Key_F10: "f10", Qt.Key.Key_F11: "f11", Qt.Key.Key_F12: "f12",
-            Qt.Key.Key_Space: "space",
-            Qt.Key.Key_Insert: "insert", Qt.Key.Key_Delete: "delete",
-            Qt.Key.Key_Home: "home", Qt.Key.Key_End: "end",
-            Qt.Key.Key_PageUp: "page_up", Qt.Key.Key_PageDown: "page_down",
-            Qt.Key.Key_Up: "up", Qt.Key.Key_Down: "down",
-            Qt.Key.Key_Left: "left", Qt.Key.Key_Right: "right",
-            Qt.Key.Key_Enter: "enter", Qt.Key.Key_Return: "return",
-            Qt.Key.Key_Tab: "tab", Qt.Key.Key_Backspace: "backspace",
-            Qt.Key.Key_Escape: "escape",
-        }
+        name = _SPECIAL_KEYS.get(key)
+        if name is not None:
+            return name
         
-        if key in special_keys:
-            return special_keys[key]
-        
-        # Handle regular character keys
-        if key >= Qt.Key.Key_A and key <= Qt.Key.Key_Z:
-            char = chr(key)
-            # Check if shift is pressed for uppercase
-            if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                return char.upper()
-            return char.lower()
-        
-        # Handle number keys
-        if key >= Qt.Key.Key_0 and key <= Qt.Key.Key_9:
-            # Map Qt key codes to characters
-            num_map = {
-                Qt.Key.Key_0: '0', Qt.Key.Key_1: '1', Qt.Key.Key_2: '2',
-                Qt.Key.Key_3: '3', Qt.Key.Key_4: '4', Qt.Key.Key_5: '5',
-                Qt.Key.Key_6: '6', Qt.Key.Key_7: '7', Qt.Key.Key_8: '8',
-                Qt.Key.Key_9: '9'
-            }
-            return num_map.get(key, chr(key))
+        # Letters and digits map arithmetically onto ASCII
+        if _KEY_A <= key <= _KEY_Z:
+            base = _ORD_UPPER_A if modifiers & Qt.KeyboardModifier.ShiftModifier else _ORD_LOWER_A
+            return chr(key - _KEY_A + base)
+        if _KEY_0 <= key <= _KEY_9:
+            return chr(key - _KEY_0 + _ORD_0)
         
         # Try to get key sequence
         try:
@@ -277,9 +326,10 @@ class SettingsWindow(QWidget):
         
         # Device selection
         self.device_combo = QComboBox()
+        self._devices_sig = None
         self.refresh_devices()
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.refresh_devices)
+        refresh_btn.clicked.connect(self._on_refresh_devices_clicked)
         device_layout = QHBoxLayout()
         device_layout.addWidget(self.device_combo)
         device_layout.addWidget(refresh_btn)
@@ -287,7 +337,9 @@ class SettingsWindow(QWidget):
         
         # Sample rate
         self.sample_rate_combo = QComboBox()
-        self.sample_rate_combo.addItems(["8000", "16000", "44100", "48000"])
+        sample_rates = [8000, 16000, 44100, 48000]
+        self.sample_rate_combo.addItems([str(rate) for rate in sample_rates])
+        self._sample_rate_index = {rate: i for i, rate in enumerate(sample_rates)}
         layout.addRow("Sample Rate:", self.sample_rate_combo)
         
         widget.setLayout(layout)
@@ -300,34 +352,36 @@ class SettingsWindow(QWidget):
         
         # Model selection
         self.model_combo = QComboBox()
-        self.model_combo.addItems(["tiny", "base", "small", "medium", "large"])
+        models = ["tiny", "base", "small", "medium", "large"]
+        self.model_combo.addItems(models)
+        self._model_index = {name: i for i, name in enumerate(models)}
         layout.addRow("Model:", self.model_combo)
         
         # Language selection
         self.language_combo = QComboBox()
-        # Common languages
-        languages = [
-            ("auto", "Auto-detect"),
-            ("en", "English"),
-            ("es", "Spanish"),
-            ("fr", "French"),
-            ("de", "German"),
-            ("it", "Italian"),
-            ("pt", "Portuguese"),
-            ("ru", "Russian"),
-            ("ja", "Japanese"),
-            ("zh", "Chinese"),
-            ("ko", "Korean"),
-        ]
-        for code, name in languages:
-            self.language_combo.addItem(f"{name} ({code})", code)
+        self.language_combo.addItems(_LANG_DISPLAY)
+        for i, (code, _) in enumerate(_LANGUAGES):
+            self.language_combo.setItemData(i, code)
         layout.addRow("Language:", self.language_combo)
         
+        # Decoding beam width
+        self.beam_size_spin = QSpinBox()
+        self.beam_size_spin.setRange(1, 5)
+        self.beam_size_spin.setToolTip("1 is fastest (greedy); larger values can be slightly more accurate")
+        layout.addRow("Beam Size:", self.beam_size_spin)
+        
         # Device (CPU/CUDA)
         self.device_combo_stt = QComboBox()
         self.device_combo_stt.addItems(["cpu", "cuda"])
         layout.addRow("Compute Device:", self.device_combo_stt)
         
+        # Numeric precision; "auto" picks int8 on CPU, int8_float16 on CUDA
+        self.compute_type_combo = QComboBox()
+        compute_types = ["auto", "int8", "int8_float16", "float16", "float32"]
+        self.compute_type_combo.addItems(compute_types)
+        self._compute_type_index = {name: i for i, name in enumerate(compute_types)}
+        layout.addRow("Compute Type:", self.compute_type_combo)
+        
         widget.setLayout(layout)
         return widget
     
@@ -364,20 +418,43 @@ class SettingsWindow(QWidget):
         widget.setLayout(layout)
         return widget
     
+    def _on_refresh_devices_clicked(self):
+        """Re-query audio devices and repopulate the list."""
+        self.audio_capture.refresh_devices()
+        self.refresh_devices()
+    
     def refresh_devices(self):
-        """Refresh list of audio devices."""
-        self.device_combo.clear()
+        """Refresh list of audio devices.
+        
+        The combo is only rebuilt when the device list differs from what it
+        already shows, and the current selection is kept across a rebuild.
+        """
         devices = self.audio_capture.list_devices()
+        sig = tuple(
+            (d['id'], d['name'], d['channels'], int(d['sample_rate'])) for d in devices
+        )
+        if sig == self._devices_sig:
+            return
+        
+        selected = self.device_combo.currentData()
+        self.device_combo.blockSignals(True)
+        self.device_combo.clear()
         self.device_combo.addItem("Default Device", None)
-        for device in devices:
-            self.device_combo.addItem(
-                f"{device['name']} ({device['channels']}ch, {int(device['sample_rate'])}Hz)",
-                device['id']
-            )
+        for device_id, name, channels, rate in sig:
+            self.device_combo.addItem(f"{name} ({channels}ch, {rate}Hz)", device_id)
+        self._device_index = {None: 0}
+        self._device_index.update((d[0], i) for i, d in enumerate(sig, 1))
+        self.device_combo.setCurrentIndex(self._device_index.get(selected, 0))
+        self.device_combo.blockSignals(False)
+        self._devices_sig = sig
     
     def load_settings(self):
-        """Load current settings into UI."""
-        # Hotkey settings
+        """Load current settings into the tabs built so far."""
+        for index in sorted(self._built_tabs):
+            self._tab_builders[index][2]()
+    
+    def _load_hotkey_settings(self):
+        """Load hotkey settings into the Hotkey tab."""
         key = self.config.get("hotkey.key", "f8")
         modifiers = self.config.get("hotkey.modifiers", [])
         
@@ -393,35 +470,38 @@ class SettingsWindow(QWidget):
         
         mode = self.config.get("hotkey.mode", "toggle")
         self.mode_combo.setCurrentIndex(0 if mode == "toggle" else 1)
-        
-        # Audio settings
-        device_id = self.config.get("audio.device_id")
-        for i in range(self.device_combo.count()):
-            if self.device_combo.itemData(i) == device_id:
-                self.device_combo.setCurrentIndex(i)
-                break
-        
-        sample_rate = str(int(self.config.get("audio.sample_rate", 16000)))
-        index = self.sample_rate_combo.findText(sample_rate)
-        if index >= 0:
+    
+    def _load_audio_settings(self):
+        """Load audio settings into the Audio tab."""
+        index = self._device_index.get(self.config.get("audio.device_id"))
+        if index is not None:
+            self.device_combo.setCurrentIndex(index)
+        
+        index = self._sample_rate_index.get(int(self.config.get("audio.sample_rate", 16000)))
+        if index is not None:
             self.sample_rate_combo.setCurrentIndex(index)
-        
-        # STT settings
-        model = self.config.get("stt.model", "base")
-        index = self.model_combo.findText(model)
-        if index >= 0:
+    
+    def _load_stt_settings(self):
+        """Load speech-to-text settings into the Speech-to-Text tab."""
+        index = self._model_index.get(self.config.get("stt.model", "base"))
+        if index is not None:
             self.model_combo.setCurrentIndex(index)
         
-        language = self.config.get("stt.language", "en")
-        for i in range(self.language_combo.count()):
-            if self.language_combo.itemData(i) == language:
-                self.language_combo.setCurrentIndex(i)
-                break
+        index = _LANG_INDEX.get(self.config.get("stt.language", "en"))
+        if index is not None:
+            self.language_combo.setCurrentIndex(index)
+        
+        self.beam_size_spin.setValue(self.config.get("stt.beam_size", 1))
         
         device = self.config.get("stt.device", "cpu")
         self.device_combo_stt.setCurrentIndex(0 if device == "cpu" else 1)
         
-        # Overlay settings
+        index = self._compute_type_index.get(self.config.get("stt.compute_type", "auto"))
+        if index is not None:
+            self.compute_type_combo.setCurrentIndex(index)
+    
+    def _load_overlay_settings(self):
+        """Load overlay settings into the Overlay tab."""
         self.overlay_enabled_check.setChecked(self.config.get("overlay.enabled", True))
         
         position = self.config.get("overlay.position", "bottom_right")
@@ -442,48 +522,47 @@ class SettingsWindow(QWidget):
     def save_settings(self):
         """Save settings from UI to config."""
         try:
+            settings = {}
+            
             # Hotkey settings
             if self.captured_key:
-                self.config.set("hotkey.key", self.captured_key.lower())
-                self.config.set("hotkey.modifiers", self.captured_modifiers)
+                settings["hotkey.key"] = normalize_key(self.captured_key)
+                settings["hotkey.modifiers"] = self.captured_modifiers
             else:
                 # Fallback to default if nothing captured
-                self.config.set("hotkey.key", "f8")
-                self.config.set("hotkey.modifiers", [])
-            
-            mode = "toggle" if self.mode_combo.currentIndex() == 0 else "hold"
-            self.config.set("hotkey.mode", mode)
+                settings["hotkey.key"] = "f8"
+                settings["hotkey.modifiers"] = []
             
-            # Audio settings
-            device_id = self.device_combo.currentData()
-            self.config.set("audio.device_id", device_id)
+            settings["hotkey.mode"] = "toggle" if self.mode_combo.currentIndex() == 0 else "hold"
             
-            sample_rate = int(self.sample_rate_combo.currentText())
-            self.config.set("audio.sample_rate", sample_rate)
+            # Audio settings (tabs never opened hold no edits, so skip them)
+            if 1 in self._built_tabs:
+                settings["audio.device_id"] = self.device_combo.currentData()
+                settings["audio.sample_rate"] = int(self.sample_rate_combo.currentText())
             
             # STT settings
-            model = self.model_combo.currentText()
-            self.config.set("stt.model", model)
-            self.stt_engine.set_model(model)
-            
-            language = self.language_combo.currentData()
-            self.config.set("stt.language", language)
-            self.stt_engine.set_language(language)
-            
-            device = self.device_combo_stt.currentText()
-            self.config.set("stt.device", device)
+            if 2 in self._built_tabs:
+                settings["stt.model"] = self.model_combo.currentText()
+                settings["stt.language"] = self.language_combo.currentData()
+                settings["stt.beam_size"] = self.beam_size_spin.value()
+                settings["stt.device"] = self.device_combo_stt.currentText()
+                settings["stt.compute_type"] = self.compute_type_combo.currentText()
             
             # Overlay settings
-            self.config.set("overlay.enabled", self.overlay_enabled_check.isChecked())
-            
-            position_map = ["top_left", "top_right", "bottom_left", "bottom_right", "center"]
-            position = position_map[self.position_combo.currentIndex()]
-            self.config.set("overlay.position", position)
-            
-            self.config.set("overlay.show_text", self.show_text_check.isChecked())
+            if 3 in self._built_tabs:
+                position_map = ["top_left", "top_right", "bottom_left", "bottom_right", "center"]
+                settings["overlay.enabled"] = self.overlay_enabled_check.isChecked()
+                settings["overlay.position"] = position_map[self.position_combo.currentIndex()]
+                settings["overlay.show_text"] = self.show_text_check.isChecked()
+                settings["overlay.opacity"] = self.opacity_spin.value() / 100.0
             
-            opacity = self.opacity_spin.value() / 100.0
-            self.config.set("overlay.opacity", opacity)
+            # One update for the whole form, then apply engine changes only
+            # once it has succeeded. A model change can take seconds to
+            # load, so the app applies it on its worker when this closes.
+            self.config.update(settings)
+            if 2 in self._built_tabs:
+                self.stt_engine.set_language(settings["stt.language"])
+                self.stt_engine.set_beam_size(settings["stt.beam_size"])
             
             QMessageBox.information(self, "Settings", "Settings saved successfully!")
             self.close()
@@ -492,6 +571,8 @@ class SettingsWindow(QWidget):
     
     def closeEvent(self, event):
         """Handle window close event."""
+        # Never leave the keyboard grabbed by a hidden window
+        self.key_capture_button.stop_capture()
         self.closed.emit()
         super().closeEvent(event)
 
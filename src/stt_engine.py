@@ -2,6 +2,7 @@
 
 import os
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Callable
 import numpy as np
@@ -11,6 +12,10 @@ from faster_whisper import WhisperModel
 class STTEngine:
     """Speech-to-text engine using faster-whisper."""
     
+    # Loaded models kept in memory, so switching back to a recent model
+    # does not reload its weights
+    MODEL_CACHE_SIZE = 2
+    
     def __init__(self, config):
         """Initialize STT engine.
         
@@ -20,12 +25,55 @@ class STTEngine:
         self.config = config
         self.model_name = config.get("stt.model", "base")
         self.language = config.get("stt.language", "en")
-        self.device = config.get("stt.device", "cpu")
+        # 1 = greedy decoding, the fastest; larger beams trade latency for accuracy
+        self.beam_size = config.get("stt.beam_size", 1)
+        # Peak-normalize before transcribing. Off by default: Whisper copes
+        # with natural mic levels, VAD already drops silence, and boosting
+        # quiet clips also boosts their noise.
+        self.normalize = config.get("stt.normalize", False)
+        self.device, self.compute_type, self.cpu_threads = self._backend_settings()
         self.model: Optional[WhisperModel] = None
         self.model_lock = threading.Lock()
+        # Reused float32 buffer for int16 input; grows to the longest
+        # recording seen. Taken with a non-blocking acquire so a concurrent
+        # caller falls back to a fresh array instead of waiting.
+        self._fbuf = np.empty(0, dtype=np.float32)
+        self._fbuf_lock = threading.Lock()
+        # Keyed by (model name, device, compute type, CPU threads), most
+        # recently used last. Has its own lock: model_lock is held for whole
+        # transcriptions.
+        self._model_cache: "OrderedDict[tuple, WhisperModel]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.models_dir = Path.home() / ".vocalnode" / "models"
         self.models_dir.mkdir(parents=True, exist_ok=True)
     
+    def _backend_settings(self) -> tuple:
+        """Read (device, compute type, CPU threads) from config, resolving defaults."""
+        device = self.config.get("stt.device", "cpu")
+        compute_type = self.config.get("stt.compute_type", "auto")
+        if compute_type == "auto":
+            # int8 weights with float16 activations use tensor cores on GPU
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+        # Leave a core free for the GUI, hotkey and capture threads
+        cpu_threads = self.config.get("stt.cpu_threads", 0) or max(1, (os.cpu_count() or 4) - 1)
+        return device, compute_type, cpu_threads
+    
+    def reload_backend(self) -> bool:
+        """Pick up changed device, compute type or thread settings from config.
+        
+        The loaded model is dropped if they changed; the next load_model()
+        builds one with the new settings, or reuses a cached one.
+        
+        Returns:
+            True if the settings changed
+        """
+        settings = self._backend_settings()
+        if settings == (self.device, self.compute_type, self.cpu_threads):
+            return False
+        self.device, self.compute_type, self.cpu_threads = settings
+        self.model = None
+        return True
+    
     def load_model(self) -> bool:
         """Load the Whisper model.
         
@@ -35,8 +83,18 @@ class STTEngine:
         if self.model is not None:
             return True
         
+        model_name = self.model_name
+        key = (model_name, self.device, self.compute_type, self.cpu_threads)
+        with self._cache_lock:
+            cached = self._model_cache.get(key)
+            if cached is not None:
+                self._model_cache.move_to_end(key)
+        if cached is not None:
+            self.model = cached
+            return True
+        
         try:
-            print(f"Loading Whisper model: {self.model_name} (device: {self.device})")
+            print(f"Loading Whisper model: {self.model_name} (device: {self.device}, compute type: {self.compute_type})")
             
             # Use local cache directory
             model_path = str(self.models_dir / self.model_name)
@@ -45,12 +103,19 @@ class STTEngine:
             if not os.path.exists(model_path):
                 print(f"Downloading model {self.model_name}...")
             
-            self.model = WhisperModel(
-                self.model_name,
+            model = WhisperModel(
+                model_name,
                 device=self.device,
-                compute_type="int8",  # Use int8 for faster inference
+                compute_type=self.compute_type,
+                cpu_threads=self.cpu_threads,
+                num_workers=1,
                 download_root=str(self.models_dir)
             )
+            with self._cache_lock:
+                self._model_cache[key] = model
+                while len(self._model_cache) > self.MODEL_CACHE_SIZE:
+                    self._model_cache.popitem(last=False)
+            self.model = model
             
             print("Model loaded successfully")
             return True
@@ -58,13 +123,96 @@ class STTEngine:
             print(f"Error loading model: {e}")
             return False
     
+    def warmup(self) -> None:
+        """Run a throwaway transcription on silence.
+        
+        The first inference pays one-time costs (allocator arenas, kernel
+        selection, lazy library loading). Paying them right after loading
+        keeps them off the user's first dictation.
+        """
+        if self.model is None:
+            return
+        
+        try:
+            with self.model_lock:
+                segments, info = self.model.transcribe(
+                    np.zeros(16000, dtype=np.float32),
+                    language=self.language if self.language != "auto" else None,
+                    beam_size=self.beam_size,
+                    vad_filter=False,  # VAD would skip silence before the model runs
+                    max_new_tokens=1
+                )
+                for _ in segments:
+                    pass
+        except Exception as e:
+            print(f"Error warming up model: {e}")
+    
     def transcribe_audio(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         """Transcribe audio to text.
         
         Args:
-            audio: Audio array (numpy array of floats)
+            audio: Audio array, int16 PCM or floats in [-1, 1]
             sample_rate: Sample rate of audio
             
+        Returns:
+            Transcribed text
+        """
+        return self.transcribe_audio_iter(audio, sample_rate)
+    
+    def transcribe_audio_iter(self, audio: np.ndarray, sample_rate: int = 16000,
+                              on_segment: Optional[Callable[[str], None]] = None) -> str:
+        """Transcribe audio, reporting each segment as soon as it is decoded.
+        
+        faster-whisper decodes lazily, so ``on_segment`` sees the first
+        segment long before the last one is ready and can start acting on it.
+        
+        Args:
+            audio: Audio array, int16 PCM or floats in [-1, 1]
+            sample_rate: Sample rate of audio
+            on_segment: Called on the calling thread with each non-empty
+                segment's stripped text, in order. Never called with the
+                model lock held, so it may block (e.g. to type the text).
+            
+        Returns:
+            Transcribed text
+        """
+        if audio.dtype == np.int16 and self._fbuf_lock.acquire(blocking=False):
+            try:
+                n = audio.size
+                if self._fbuf.size < n:
+                    self._fbuf = np.empty(n, dtype=np.float32)
+                buf = self._fbuf[:n]
+                # Convert and scale in a single pass: to the peak of the
+                # int16 samples (Python ints, so -32768 cannot overflow) when
+                # normalizing, otherwise to the fixed [-1, 1) PCM range
+                peak = max(int(audio.max()), -int(audio.min())) if self.normalize and n else 0
+                np.multiply(audio, np.float32(1.0 / (peak or 32768)), out=buf)
+                return self._transcribe_float32(buf, True, on_segment, normalized=True)
+            finally:
+                self._fbuf_lock.release()
+        
+        # Ensure audio is float32, bringing int16 PCM into [-1, 1)
+        owned = audio.dtype != np.float32
+        if owned:
+            if audio.dtype == np.int16:
+                audio = np.multiply(audio, np.float32(1.0 / 32768))
+            else:
+                audio = audio.astype(np.float32)
+        return self._transcribe_float32(audio, owned, on_segment)
+    
+    def _transcribe_float32(self, audio: np.ndarray, owned: bool,
+                            on_segment: Optional[Callable[[str], None]] = None,
+                            normalized: bool = False) -> str:
+        """Peak-normalize float32 audio and run the model on it.
+        
+        Args:
+            audio: Float32 audio array
+            owned: True if ``audio`` is a private buffer that may be
+                normalized in place
+            on_segment: Optional per-segment callback, see transcribe_audio_iter
+            normalized: True if ``audio`` is already scaled and needs no
+                peak normalization
+            
         Returns:
             Transcribed text
         """
@@ -73,31 +221,47 @@ class STTEngine:
                 return ""
         
         try:
+            # Plain NumPy work, so it stays outside the model lock.
+            # Two reductions find the peak without an abs() temporary, then
+            # one multiply scales it; in place if the array is our own copy
+            if self.normalize and audio.size and not normalized:
+                peak = max(float(audio.max()), -float(audio.min()))
+                if peak > 0:
+                    audio = np.multiply(audio, 1.0 / peak, out=audio if owned else None)
+            
             with self.model_lock:
-                # Ensure audio is float32 and normalized
-                if audio.dtype != np.float32:
-                    audio = audio.astype(np.float32)
-                
-                # Normalize audio
-                if np.max(np.abs(audio)) > 0:
-                    audio = audio / np.max(np.abs(audio))
-                
-                # Transcribe
+                # CTranslate2 releases the GIL while encoding and decoding,
+                # so callers should run this on a worker thread: the Qt and
+                # hotkey threads keep running while the model works.
                 segments, info = self.model.transcribe(
                     audio,
                     language=self.language if self.language != "auto" else None,
-                    beam_size=5,
+                    beam_size=self.beam_size,
+                    best_of=self.beam_size,
+                    temperature=0.0,  # Deterministic; no sampling fallback
                     vad_filter=True,  # Voice activity detection
                     vad_parameters=dict(min_silence_duration_ms=500)
                 )
-                
-                # Collect text from segments
-                text_parts = []
-                for segment in segments:
-                    text_parts.append(segment.text.strip())
-                
-                text = " ".join(text_parts).strip()
-                return text
+            
+            # Segments are decoded lazily, as they are iterated. Hold the
+            # lock only while one is decoded, so on_segment (which may type
+            # for a while) never runs under it.
+            text_parts = []
+            segments = iter(segments)
+            while True:
+                with self.model_lock:
+                    segment = next(segments, None)
+                if segment is None:
+                    break
+                part = segment.text.strip()
+                if not part:
+                    continue
+                text_parts.append(part)
+                if on_segment is not None:
+                    on_segment(part)
+            
+            text = " ".join(text_parts).strip()
+            return text
         except Exception as e:
             print(f"Error transcribing audio: {e}")
             return ""
@@ -115,9 +279,19 @@ class STTEngine:
         if not audio_chunks:
             return ""
         
-        # Concatenate all chunks
-        audio = np.concatenate(audio_chunks)
-        return self.transcribe_audio(audio, sample_rate)
+        # Copy every chunk straight into one float32 buffer: a single
+        # allocation, converting int16 on the way, and the buffer can then
+        # be normalized in place
+        total = sum(chunk.shape[0] for chunk in audio_chunks)
+        audio = np.empty(total, dtype=np.float32)
+        offset = 0
+        for chunk in audio_chunks:
+            n = chunk.shape[0]
+            np.copyto(audio[offset:offset + n], chunk, casting='same_kind')
+            offset += n
+        if audio_chunks[0].dtype == np.int16 and not self.normalize:
+            audio *= np.float32(1.0 / 32768)
+        return self._transcribe_float32(audio, owned=True)
     
     def set_language(self, language: str) -> None:
         """Set transcription language.
@@ -128,6 +302,15 @@ class STTEngine:
         self.language = language
         self.config.set("stt.language", language)
     
+    def set_beam_size(self, beam_size: int) -> None:
+        """Set the decoding beam width.
+        
+        Args:
+            beam_size: 1 for greedy decoding, up to 5 for beam search
+        """
+        self.beam_size = beam_size
+        self.config.set("stt.beam_size", beam_size)
+    
     def set_model(self, model_name: str) -> bool:
         """Change the model.
         
@@ -137,11 +320,11 @@ class STTEngine:
         Returns:
             True if model changed successfully
         """
-        if model_name == self.model_name:
+        if model_name == self.model_name and self.model is not None:
             return True
         
         self.model_name = model_name
         self.config.set("stt.model", model_name)
-        self.model = None  # Force reload
+        self.model = None  # Reuse from the cache, or load
         return self.load_model()
 
@@ -1,29 +1,102 @@
 """Text insertion into active window."""
 
 import time
-import json
-from typing import Optional
+import platform
+import re
+import threading
+from functools import partial
+from typing import Callable, Optional
 from pynput import keyboard
 from pynput.keyboard import Key, Controller
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
 
-# #region agent log
-DEBUG_LOG_PATH = "/home/jb/dev/VocalNode/.cursor/debug.log"
-def _debug_log(session_id, run_id, hypothesis_id, location, message, data=None):
-    try:
-        with open(DEBUG_LOG_PATH, 'a') as f:
-            log_entry = {
-                "sessionId": session_id,
-                "runId": run_id,
-                "hypothesisId": hypothesis_id,
-                "location": location,
-                "message": message,
-                "data": data or {},
-                "timestamp": int(time.time() * 1000)
-            }
-            f.write(json.dumps(log_entry) + "\n")
-    except:
-        pass
-# #endregion
+from .debug_log import DEBUG, debug_log as _debug_log
+
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
+# Newlines and tabs are sent as key presses; everything between them is typed
+# in one call
+_CONTROL_SPLIT = re.compile(r'([\n\t])')
+_CONTROL_KEYS = {'\n': Key.enter, '\t': Key.tab}
+# Longest run typed before pausing for typing_delay
+TYPING_CHUNK = 64
+# Largest typing_delay honoured, in seconds
+MAX_TYPING_DELAY = 0.05
+# In "auto" mode, text longer than this is pasted instead of typed
+CLIPBOARD_MIN_CHARS = 20
+# Previous clipboard contents larger than this are not restored
+CLIPBOARD_RESTORE_MAX = 1_000_000
+# Seconds to wait after pasting before restoring the previous clipboard;
+# the target application reads the clipboard asynchronously
+CLIPBOARD_RESTORE_DELAY = 0.3
+# Marks that no clipboard contents are waiting to be restored
+_NOTHING_SAVED = object()
+
+
+class _QtClipboard(QObject):
+    """The Qt clipboard, usable from any thread.
+    
+    QClipboard talks to the platform clipboard directly, where pyperclip
+    forks xclip/xsel on Linux for every read and write, but it may only be
+    touched on the GUI thread. Calls on the GUI thread run directly; calls
+    from other threads are queued there and wait at most CALL_TIMEOUT
+    seconds, so a busy or stopped event loop cannot hang the caller. Must be
+    created on the GUI thread.
+    """
+    
+    # Seconds a non-GUI thread waits for the GUI thread to run a call
+    CALL_TIMEOUT = 2.0
+    
+    _call = pyqtSignal(object)
+    
+    def __init__(self):
+        super().__init__()
+        self._clipboard = QGuiApplication.clipboard()
+        self._call.connect(self._run, Qt.ConnectionType.QueuedConnection)
+    
+    def _run(self, fn: Callable):
+        fn()
+    
+    def _on_gui_thread(self, fn: Callable):
+        if QThread.currentThread() == self.thread():
+            fn()
+            return
+        done = threading.Event()
+        cancelled = threading.Event()
+        # Makes "run unless cancelled" and "cancel unless done" atomic
+        guard = threading.Lock()
+        
+        def call():
+            with guard:
+                try:
+                    # The caller gave up; touching the clipboard now could
+                    # undo a later restore_clipboard()
+                    if not cancelled.is_set():
+                        fn()
+                finally:
+                    done.set()
+        
+        self._call.emit(call)
+        if not done.wait(self.CALL_TIMEOUT):
+            with guard:
+                if done.is_set():
+                    return  # Finished just as the wait expired
+                cancelled.set()
+            raise TimeoutError("GUI thread did not answer the clipboard call")
+    
+    def paste(self) -> str:
+        """Return the clipboard text (same interface as pyperclip)."""
+        result = []
+        self._on_gui_thread(lambda: result.append(self._clipboard.text()))
+        return result[0]
+    
+    def copy(self, text: str) -> None:
+        """Replace the clipboard text (same interface as pyperclip)."""
+        self._on_gui_thread(partial(self._clipboard.setText, text))
 
 
 class TextInserter:
@@ -37,42 +110,93 @@ class TextInserter:
         """
         self.config = config
         self.keyboard = Controller()
-        self.typing_delay = config.get("text_insertion.typing_delay", 0.01)
-        self.method = config.get("text_insertion.method", "typing")
+        # pynput's backends pace input themselves, so no pause by default
+        self.typing_delay = min(max(float(config.get("text_insertion.typing_delay", 0.0)), 0.0), MAX_TYPING_DELAY)
+        self.method = config.get("text_insertion.method", "auto")
+        # Ctrl+V on Windows/Linux, Cmd+V on macOS
+        self._paste_modifier = Key.cmd if platform.system() == "Darwin" else Key.ctrl
+        # Prefer Qt's clipboard when the app is running; pyperclip covers
+        # use without a QApplication
+        self._clipboard = _QtClipboard() if QGuiApplication.instance() is not None else pyperclip
+        self._clipboard_ok = self._probe_clipboard()
+        # Clipboard contents from before the first paste since the last
+        # restore_clipboard()
+        self._saved_clipboard = _NOTHING_SAVED
+    
+    def _probe_clipboard(self) -> bool:
+        """Check once whether the clipboard backend works."""
+        if self._clipboard is None:
+            return False
+        try:
+            self._clipboard.paste()
+            return True
+        except Exception:
+            return False
     
-    def insert_text(self, text: str) -> bool:
+    def choose_method(self, text: str) -> str:
+        """Resolve the configured method to "clipboard" or "typing" for text.
+        
+        Pasting costs the same at any length while typing grows with the
+        text, so "auto" pastes anything but short snippets. When a dictation
+        is inserted in pieces, call this once with the first piece and pass
+        the result to every insert_text() call, so one dictation is never
+        part typed, part pasted.
+        
+        Args:
+            text: Text (or first piece of it) about to be inserted
+            
+        Returns:
+            "clipboard" or "typing"
+        """
+        if self.method == "clipboard" or (
+            self.method == "auto" and self._clipboard_ok and len(text) > CLIPBOARD_MIN_CHARS
+        ):
+            return "clipboard"
+        return "typing"
+    
+    def insert_text(self, text: str, restore_clipboard: bool = True, method: Optional[str] = None) -> bool:
         """Insert text into the active window.
         
         Args:
             text: Text to insert
+            restore_clipboard: Restore the previous clipboard after pasting.
+                Pass False when inserting a dictation in several pieces and
+                call restore_clipboard() after the last one.
+            method: "clipboard" or "typing" from choose_method(); chosen
+                from ``text`` if None
             
         Returns:
             True if successful, False otherwise
         """
         # #region agent log
-        _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:entry", "insert_text called", {"text_length": len(text), "method": self.method, "text_preview": text[:50]})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:entry", "insert_text called", {"text_length": len(text), "method": self.method, "text_preview": text[:50]})
         # #endregion
         if not text or not text.strip():
             # #region agent log
-            _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:empty", "Text is empty, returning False")
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:empty", "Text is empty, returning False")
             # #endregion
             return False
         
         try:
-            if self.method == "clipboard":
+            if (method or self.choose_method(text)) == "clipboard":
                 # #region agent log
-                _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:clipboard", "Using clipboard method")
+                if DEBUG:
+                    _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:clipboard", "Using clipboard method")
                 # #endregion
-                return self._insert_via_clipboard(text)
+                return self._insert_via_clipboard(text, restore_clipboard)
             else:
                 # #region agent log
-                _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:typing", "Using typing method")
+                if DEBUG:
+                    _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:typing", "Using typing method")
                 # #endregion
                 return self._insert_via_typing(text)
         except Exception as e:
             print(f"Error inserting text: {e}")
             # #region agent log
-            _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:exception", "Exception in insert_text", {"error": str(e), "type": type(e).__name__})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H5", "text_inserter.py:insert_text:exception", "Exception in insert_text", {"error": str(e), "type": type(e).__name__})
             # #endregion
             return False
     
@@ -86,78 +210,96 @@ class TextInserter:
             True if successful
         """
         # #region agent log
-        _debug_log("debug-session", "run1", "H5", "text_inserter.py:_insert_via_typing:entry", "Typing method started", {"text_length": len(text), "typing_delay": self.typing_delay})
+        if DEBUG:
+            _debug_log("debug-session", "run1", "H5", "text_inserter.py:_insert_via_typing:entry", "Typing method started", {"text_length": len(text), "typing_delay": self.typing_delay})
         # #endregion
+        chars_typed = 0
         try:
-            chars_typed = 0
-            # Type character by character with small delay
-            for char in text:
-                chars_typed += 1
-                if char == '\n':
-                    self.keyboard.press(Key.enter)
-                    self.keyboard.release(Key.enter)
-                elif char == '\t':
-                    self.keyboard.press(Key.tab)
-                    self.keyboard.release(Key.tab)
-                else:
-                    self.keyboard.type(char)
-                time.sleep(self.typing_delay)
+            # Type runs of plain text in chunks, pausing once per chunk
+            # rather than once per character
+            delay = self.typing_delay
+            for segment in _CONTROL_SPLIT.split(text):
+                if not segment:
+                    continue
+                key = _CONTROL_KEYS.get(segment)
+                if key is not None:
+                    self.keyboard.press(key)
+                    self.keyboard.release(key)
+                    chars_typed += 1
+                    continue
+                for i in range(0, len(segment), TYPING_CHUNK):
+                    chunk = segment[i:i + TYPING_CHUNK]
+                    self.keyboard.type(chunk)
+                    chars_typed += len(chunk)
+                    if delay >= 0.001:
+                        time.sleep(delay)
             # #region agent log
-            _debug_log("debug-session", "run1", "H5", "text_inserter.py:_insert_via_typing:success", "Typing completed", {"chars_typed": chars_typed})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H5", "text_inserter.py:_insert_via_typing:success", "Typing completed", {"chars_typed": chars_typed})
             # #endregion
             return True
         except Exception as e:
             print(f"Error typing text: {e}")
             # #region agent log
-            _debug_log("debug-session", "run1", "H5", "text_inserter.py:_insert_via_typing:exception", "Exception in typing", {"error": str(e), "type": type(e).__name__, "chars_typed": chars_typed})
+            if DEBUG:
+                _debug_log("debug-session", "run1", "H5", "text_inserter.py:_insert_via_typing:exception", "Exception in typing", {"error": str(e), "type": type(e).__name__, "chars_typed": chars_typed})
             # #endregion
             return False
     
-    def _insert_via_clipboard(self, text: str) -> bool:
+    def _insert_via_clipboard(self, text: str, restore: bool = True) -> bool:
         """Insert text via clipboard paste.
         
         Args:
             text: Text to paste
+            restore: Restore the previous clipboard afterwards
             
         Returns:
             True if successful
         """
+        clipboard = self._clipboard
+        if clipboard is None:
+            print("pyperclip not installed, falling back to typing method")
+            return self._insert_via_typing(text)
+        
         try:
-            import pyperclip
-            
-            # Save current clipboard
-            try:
-                old_clipboard = pyperclip.paste()
-            except:
-                old_clipboard = None
+            # Save current clipboard, unless an earlier paste of the same
+            # dictation already did (it would now hold our own text)
+            if self._saved_clipboard is _NOTHING_SAVED:
+                try:
+                    self._saved_clipboard = clipboard.paste()
+                except:
+                    self._saved_clipboard = None
             
             # Copy text to clipboard
-            pyperclip.copy(text)
+            clipboard.copy(text)
             
-            # Paste using Ctrl+V (Windows/Linux) or Cmd+V (macOS)
-            import platform
-            if platform.system() == "Darwin":  # macOS
-                with self.keyboard.pressed(Key.cmd):
-                    self.keyboard.press('v')
-                    self.keyboard.release('v')
-            else:  # Windows/Linux
-                with self.keyboard.pressed(Key.ctrl):
-                    self.keyboard.press('v')
-                    self.keyboard.release('v')
+            # Paste using the platform's paste shortcut
+            with self.keyboard.pressed(self._paste_modifier):
+                self.keyboard.press('v')
+                self.keyboard.release('v')
             
-            # Restore old clipboard after a delay
-            time.sleep(0.1)
-            if old_clipboard is not None:
-                try:
-                    pyperclip.copy(old_clipboard)
-                except:
-                    pass
+            if restore:
+                self.restore_clipboard()
             
             return True
-        except ImportError:
-            print("pyperclip not installed, falling back to typing method")
-            return self._insert_via_typing(text)
         except Exception as e:
             print(f"Error pasting text: {e}")
             return False
+    
+    def restore_clipboard(self) -> None:
+        """Put back the clipboard contents saved by the first paste.
+        
+        Does nothing if nothing was pasted since the last restore.
+        """
+        old_clipboard = self._saved_clipboard
+        self._saved_clipboard = _NOTHING_SAVED
+        # Nothing to do if there is nothing worth restoring
+        if old_clipboard is _NOTHING_SAVED or not old_clipboard or len(old_clipboard) > CLIPBOARD_RESTORE_MAX:
+            return
+        # Give the target application time to read the pasted text first
+        time.sleep(CLIPBOARD_RESTORE_DELAY)
+        try:
+            self._clipboard.copy(old_clipboard)
+        except:
+            pass
 
@@ -1,9 +1,137 @@
 """System tray icon and menu."""
 
+import sys
+import time
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QPen
-from PyQt6.QtCore import QObject, pyqtSignal, Qt
-from typing import Optional
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QPixmapCache, QPainter, QPainterPath, QColor, QPen
+from PyQt6.QtCore import QObject, QSignalBlocker, QThreadPool, QTimer, pyqtSignal, pyqtSlot, Qt
+from typing import Dict, Optional, Tuple
+
+# Drawing resources shared by every icon render
+# Qt.GlobalColor values are passed through without building a QColor
+_TRANSPARENT = Qt.GlobalColor.transparent
+_WHITE = Qt.GlobalColor.white
+_WHITE_PEN = QPen(_WHITE, 2)
+_NO_PEN = Qt.PenStyle.NoPen
+_AA = QPainter.RenderHint.Antialiasing
+
+# Icon geometry in logical pixels on a 32x32 canvas
+_ICON_SIZE = 32
+_ELLIPSE_RECT = (4, 4, 24, 24)
+_LINE = (16, 10, 16, 20)  # Mic body
+_ARC_RECT = (12, 20, 8, 4)  # Mic base
+_ARC_START = 0
+_ARC_SPAN = 180  # Degrees
+
+
+def _build_mic_paths() -> Tuple[QPainterPath, QPainterPath]:
+    """Build the disc and microphone glyph outlines.
+    
+    Each shape is then drawn with a single drawPath() call instead of one
+    call per primitive.
+    """
+    disc = QPainterPath()
+    disc.addEllipse(*_ELLIPSE_RECT)
+    glyph = QPainterPath()
+    glyph.moveTo(*_LINE[:2])
+    glyph.lineTo(*_LINE[2:])
+    glyph.arcMoveTo(*_ARC_RECT, _ARC_START)  # Start a new subpath on the arc
+    glyph.arcTo(*_ARC_RECT, _ARC_START, _ARC_SPAN)
+    return disc, glyph
+
+
+_DISC_PATH, _GLYPH_PATH = _build_mic_paths()
+
+# Menu and tooltip text for each state
+_TXT_START = "Start Dictation"
+_TXT_STOP = "Stop Dictation"
+_TXT_PROC = "Processing..."
+_TIP_LISTEN = "VocalNode - Listening..."
+_TIP_PROC = "VocalNode - Processing..."
+_TIP_READY = "VocalNode - Ready"
+
+# Background color of the drawn icon in each state
+_ICON_COLORS = {
+    "idle": QColor(66, 133, 244),  # Blue
+    "listening": QColor(76, 175, 80),  # Green
+}
+
+# Freedesktop icon theme names tried, per state, before drawing our own
+# icon. Listening uses the record symbol so it stays clearly distinct from
+# idle; most themes' microphone variants look alike.
+_THEME_ICONS = {
+    "idle": "audio-input-microphone",
+    "listening": "media-record",
+}
+
+
+def _new_image(dpr: float) -> QImage:
+    """Transparent 32x32 (device-independent) image at full device resolution.
+    
+    Premultiplied ARGB is the raster engine's native format, so painting
+    and compositing into it need no conversions, and unlike a QPixmap it
+    never lives in the windowing system.
+    """
+    size = round(_ICON_SIZE * dpr)
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(_TRANSPARENT)
+    return image
+
+
+def _render_mic_layers(dpr: float = 1.0) -> Tuple[QImage, QImage]:
+    """Rasterize the icon's shapes once, independent of its color.
+    
+    Args:
+        dpr: Device pixel ratio to render at
+        
+    Returns:
+        (disc, glyph): an opaque circle used as a mask for the background
+        color, and the white microphone symbol drawn on top of it
+    """
+    disc = _new_image(dpr)
+    painter = QPainter(disc)
+    painter.setRenderHint(_AA)
+    painter.setBrush(_WHITE)
+    painter.setPen(_NO_PEN)
+    painter.drawPath(_DISC_PATH)
+    painter.end()
+    
+    # The glyph is a 2 px stroke on pixel boundaries and barely changes
+    # with antialiasing, so only the disc's curved edge pays for it
+    glyph = _new_image(dpr)
+    painter = QPainter(glyph)
+    painter.setPen(_WHITE_PEN)
+    painter.drawPath(_GLYPH_PATH)
+    painter.end()
+    return disc, glyph
+
+
+def _tint_mic_image(disc: QImage, glyph: QImage, color: QColor) -> QImage:
+    """Compose a colored icon from the layers of _render_mic_layers().
+    
+    SourceIn paints the color only where the disc is opaque, keeping its
+    antialiased edge; the glyph is then blitted over it. No shapes are
+    rasterized here.
+    """
+    image = QImage(disc)  # Implicitly shared; detaches when painted
+    painter = QPainter(image)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+    painter.fillRect(image.rect(), color)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+    painter.drawImage(0, 0, glyph)
+    painter.end()
+    return image
+
+
+def _render_icon_images(dpr: float) -> Dict[str, QImage]:
+    """Paint the icon for every state in _ICON_COLORS.
+    
+    Only QImages and QPainter are used, so this is safe to run off the GUI
+    thread.
+    """
+    layers = _render_mic_layers(dpr)
+    return {name: _tint_mic_image(*layers, color) for name, color in _ICON_COLORS.items()}
 
 
 class TrayIcon(QObject):
@@ -12,66 +140,158 @@ class TrayIcon(QObject):
     show_settings = pyqtSignal()
     toggle_dictation = pyqtSignal()
     quit_app = pyqtSignal()
+    # Emitted from a pool thread; queued to the GUI thread
+    _icons_rendered = pyqtSignal(object)
+    
+    # Identical notifications closer together than this are shown once
+    MESSAGE_DEDUPE_SECONDS = 1.0
+    # At most one notification per interval; later ones in the interval are
+    # coalesced into the most recent
+    MESSAGE_INTERVAL_MS = 250
     
     def __init__(self):
         """Initialize tray icon."""
         super().__init__()
+        self._last_state = (None, None)  # Last (is_listening, is_processing) shown
+        self._last_msg = None  # Last (title, message, icon) notified
+        self._last_msg_time = 0.0
+        self._pending_msg = None  # Newest notification held back by the throttle
+        self.menu: Optional[QMenu] = None
+        self.toggle_action = None
+        self._toggle_text = _TXT_START  # Applied when the menu is built
+        self._icon_state = "idle"  # Key into _icons of the icon shown
+        # Without a tray (headless sessions, some Wayland compositors) there
+        # is nothing to draw into; every method below becomes a no-op
+        self.tray_icon: Optional[QSystemTrayIcon] = None
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            return
         self.tray_icon = QSystemTrayIcon()
+        self._msg_timer = QTimer(self)
+        self._msg_timer.setSingleShot(True)
+        self._msg_timer.setInterval(self.MESSAGE_INTERVAL_MS)
+        self._msg_timer.timeout.connect(self._flush_message)
         self.setup_icon()
-        self.setup_menu()
+        # Build the menu once the event loop is running rather than during
+        # startup. It has to exist before the first right-click, since some
+        # platforms (e.g. StatusNotifier over DBus) export it ahead of time.
+        QTimer.singleShot(0, self.setup_menu)
+        self.tray_icon.activated.connect(self.setup_menu)
         self.tray_icon.setToolTip("VocalNode - Speech to Text")
         self.tray_icon.show()
     
     def setup_icon(self):
         """Setup the tray icon."""
-        # Create a simple icon programmatically
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # There are only two looks, so build each once and swap between them.
+        # Each state uses the theme's icon if it has one, else a drawn one.
+        app = QApplication.instance()
+        self._dpr = app.devicePixelRatio() if app is not None else 1.0
+        self._icons: Dict[str, QIcon] = {}
+        self._drawn = set()  # States shown with a drawn icon
+        for name in _ICON_COLORS:
+            icon = self._theme_icon(name)
+            if icon is None:
+                self._drawn.add(name)
+                icon = self._cached_icon(name)
+            if icon is not None:
+                self._icons[name] = icon
+        if len(self._icons) < len(_ICON_COLORS):
+            # Paint on a pool thread so startup does not wait for it; the
+            # tray shows an empty icon for that moment
+            for name in self._drawn:
+                self._icons.setdefault(name, QIcon())
+            self._icons_rendered.connect(self._on_icons_rendered)
+            dpr = self._dpr
+            QThreadPool.globalInstance().start(
+                lambda: self._icons_rendered.emit(_render_icon_images(dpr))
+            )
+        self._set_icon(self._icon_state)
+    
+    def _theme_icon(self, name: str) -> Optional[QIcon]:
+        """Return the desktop icon theme's icon for a state, if it has one.
         
-        # Draw microphone icon (simplified)
-        painter.setBrush(QColor(66, 133, 244))  # Blue
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(4, 4, 24, 24)
+        Theme icons on Linux/XDG desktops are already rasterized and cached
+        by Qt, and match the rest of the panel.
         
-        # Draw microphone symbol
-        painter.setPen(QPen(QColor(255, 255, 255), 2))
-        # Mic body
-        painter.drawLine(16, 10, 16, 20)
-        # Mic base
-        painter.drawArc(12, 20, 8, 4, 0, 180 * 16)
+        Returns:
+            The icon, or None off Linux or if the theme lacks it
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        icon = QIcon.fromTheme(_THEME_ICONS[name])
+        return None if icon.isNull() else icon
+    
+    def _cache_key(self, name: str) -> str:
+        """QPixmapCache key of a drawn state icon at the current pixel ratio."""
+        return f"vocalnode:tray:{name}@{self._dpr}"
+    
+    def _cached_icon(self, name: str) -> Optional[QIcon]:
+        """Return a drawn state icon from Qt's global QPixmapCache.
         
-        painter.end()
+        A rebuilt tray icon (or any other consumer) reuses the pixmaps
+        instead of painting them again.
         
-        icon = QIcon(pixmap)
-        self.tray_icon.setIcon(icon)
+        Returns:
+            The icon, or None if it has not been painted yet
+        """
+        pixmap = QPixmapCache.find(self._cache_key(name))
+        return QIcon(pixmap) if pixmap is not None else None
     
+    @pyqtSlot(object)
+    def _on_icons_rendered(self, images: Dict[str, QImage]):
+        """Install the icons painted by the pool thread."""
+        for name, image in images.items():
+            # Always convert with fromImage(): QPixmap(QImage) is emulated in
+            # the bindings and measurably slower. QPixmaps may only be made
+            # on the GUI thread, hence the conversion here.
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(self._cache_key(name), pixmap)
+            if name in self._drawn:
+                self._icons[name] = QIcon(pixmap)
+        # Re-apply whichever look the current state uses; processing keeps
+        # the listening icon, so the state flags alone are not enough
+        self._set_icon(self._icon_state)
+    
+    @pyqtSlot()
     def setup_menu(self):
-        """Setup context menu."""
+        """Setup context menu, unless it already exists."""
+        if self.menu is not None or self.tray_icon is None:
+            return
         menu = QMenu()
         
         # Toggle dictation
-        toggle_action = menu.addAction("Start Dictation")
-        toggle_action.triggered.connect(self.toggle_dictation.emit)
+        toggle_action = menu.addAction(self._toggle_text)
+        toggle_action.triggered.connect(self._on_toggle)
         
         menu.addSeparator()
         
         # Settings
         settings_action = menu.addAction("Settings")
-        settings_action.triggered.connect(self.show_settings.emit)
+        settings_action.triggered.connect(self._on_settings)
         
         menu.addSeparator()
         
         # Quit
         quit_action = menu.addAction("Quit")
-        quit_action.triggered.connect(self.quit_app.emit)
+        quit_action.triggered.connect(self._on_quit)
         
         self.tray_icon.setContextMenu(menu)
         self.menu = menu
         self.toggle_action = toggle_action
     
+    # Decorated slots are registered with Qt statically, so menu actions
+    # connect to them without creating dynamic slots
+    @pyqtSlot()
+    def _on_toggle(self):
+        self.toggle_dictation.emit()
+    
+    @pyqtSlot()
+    def _on_settings(self):
+        self.show_settings.emit()
+    
+    @pyqtSlot()
+    def _on_quit(self):
+        self.quit_app.emit()
+    
     def update_state(self, is_listening: bool, is_processing: bool = False):
         """Update icon and menu based on state.
         
@@ -79,60 +299,45 @@ class TrayIcon(QObject):
             is_listening: True if currently listening
             is_processing: True if processing audio
         """
-        if is_listening:
-            self.toggle_action.setText("Stop Dictation")
-            self.tray_icon.setToolTip("VocalNode - Listening...")
-            # Change icon color to green when listening
-            self.set_listening_icon()
-        elif is_processing:
-            self.toggle_action.setText("Processing...")
-            self.tray_icon.setToolTip("VocalNode - Processing...")
-        else:
-            self.toggle_action.setText("Start Dictation")
-            self.tray_icon.setToolTip("VocalNode - Ready")
-            self.set_idle_icon()
+        # Each tray update is a round trip through the platform plugin;
+        # skip it when nothing visible would change
+        state = (is_listening, is_processing)
+        if state == self._last_state or self.tray_icon is None:
+            return
+        self._last_state = state
+        
+        # Nothing listens to the intermediate change notifications of this
+        # batch, so keep them from being emitted
+        with QSignalBlocker(self.tray_icon):
+            if is_listening:
+                self._toggle_text = _TXT_STOP
+                self.tray_icon.setToolTip(_TIP_LISTEN)
+                # Change icon color to green when listening
+                self.set_listening_icon()
+            elif is_processing:
+                self._toggle_text = _TXT_PROC
+                self.tray_icon.setToolTip(_TIP_PROC)
+            else:
+                self._toggle_text = _TXT_START
+                self.tray_icon.setToolTip(_TIP_READY)
+                self.set_idle_icon()
+            if self.toggle_action is not None:
+                with QSignalBlocker(self.toggle_action):
+                    self.toggle_action.setText(self._toggle_text)
     
     def set_listening_icon(self):
         """Set icon to listening state (green)."""
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(0, 0, 0, 0))
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setBrush(QColor(76, 175, 80))  # Green
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(4, 4, 24, 24)
-        
-        painter.setPen(QPen(QColor(255, 255, 255), 2))
-        painter.drawLine(16, 10, 16, 20)
-        painter.drawArc(12, 20, 8, 4, 0, 180 * 16)
-        
-        painter.end()
-        
-        icon = QIcon(pixmap)
-        self.tray_icon.setIcon(icon)
+        self._set_icon("listening")
     
     def set_idle_icon(self):
         """Set icon to idle state (blue)."""
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(0, 0, 0, 0))
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setBrush(QColor(66, 133, 244))  # Blue
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(4, 4, 24, 24)
-        
-        painter.setPen(QPen(QColor(255, 255, 255), 2))
-        painter.drawLine(16, 10, 16, 20)
-        painter.drawArc(12, 20, 8, 4, 0, 180 * 16)
-        
-        painter.end()
-        
-        icon = QIcon(pixmap)
-        self.tray_icon.setIcon(icon)
+        self._set_icon("idle")
+    
+    def _set_icon(self, name: str):
+        """Show the icon of a state in _ICON_COLORS and remember it."""
+        self._icon_state = name
+        if self.tray_icon is not None:
+            self.tray_icon.setIcon(self._icons[name])
     
     def show_message(self, title: str, message: str, icon: QSystemTrayIcon.MessageIcon = QSystemTrayIcon.MessageIcon.Information):
         """Show a tray notification.
@@ -142,5 +347,35 @@ class TrayIcon(QObject):
             message: Notification message
             icon: Icon type
         """
+        if self.tray_icon is None:
+            return
+        # Each notification is a call into the platform's notification
+        # service (DBus, Win32), which can stall the GUI thread. The first
+        # one goes out at once; a burst after it only shows its last message.
+        msg = (title, message, icon)
+        if self._msg_timer.isActive():
+            self._pending_msg = msg
+            return
+        self._show_now(msg)
+    
+    @pyqtSlot()
+    def _flush_message(self):
+        """Show the notification held back during the last interval."""
+        msg = self._pending_msg
+        self._pending_msg = None
+        if msg is not None:
+            self._show_now(msg)
+    
+    def _show_now(self, msg: Tuple[str, str, QSystemTrayIcon.MessageIcon]):
+        """Show a (title, message, icon) notification and start the throttle."""
+        # Drop an identical notification repeated within a second, e.g. the
+        # same error reported by several code paths
+        now = time.monotonic()
+        if msg == self._last_msg and now - self._last_msg_time < self.MESSAGE_DEDUPE_SECONDS:
+            return
+        self._last_msg = msg
+        self._last_msg_time = now
+        title, message, icon = msg
         self.tray_icon.showMessage(title, message, icon, 3000)
+        self._msg_timer.start()
 